@@ -10,16 +10,133 @@ Includes simple placeholder substitution. No retry/backoff in V1.
 
 from __future__ import annotations
 
-import json
-import shlex
+import os
+import re
+import selectors
 import subprocess
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-try:
-    import requests  # optional; used if installed and http actions are enabled
-except Exception:  # pragma: no cover
-    requests = None  # type: ignore
+from . import jsonutil
+
+# python-requests is optional and imported lazily on the first http action
+# (keeps CLI/shell-only startup free of the requests/urllib3 import graph).
+_requests: Any = None
+_requests_missing = False
+
+
+def _get_requests() -> Any:
+    """
+    Return the requests module, or None if it is not installed.
+    """
+    global _requests, _requests_missing
+    if _requests is None and not _requests_missing:
+        try:
+            import requests as _mod
+            import requests.adapters  # noqa: F401
+            _requests = _mod
+        except Exception:  # pragma: no cover
+            _requests_missing = True
+    return _requests
+
+
+# Shared HTTP session (connection pooling / keep-alive across actions)
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_http_session():
+    """
+    Return the process-wide requests.Session, creating it on first use.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                requests = _get_requests()
+                sess = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                sess.mount("http://", adapter)
+                sess.mount("https://", adapter)
+                _SESSION = sess
+    return _SESSION
+
+
+def close_http_session() -> None:
+    """
+    Close the shared HTTP session (if any). Safe to call multiple times.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        sess, _SESSION = _SESSION, None
+    if sess is not None:
+        try:
+            sess.close()
+        except Exception:
+            pass
+
+
+@dataclass(frozen=True, slots=True)
+class HttpActionSpec:
+    """Normalized http action (see run_http_action for the dict schema)."""
+    name: str
+    method: str
+    url: str
+    headers: Dict[str, Any]
+    json_body: Any = None
+    data_body: Any = None
+    params: Any = None
+    body_is_text: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ShellActionSpec:
+    """Normalized shell action (see run_shell_action for the dict schema)."""
+    name: str
+    command: str
+    args: Tuple[Any, ...] = ()
+    use_shell: bool = False
+
+
+ActionSpec = Union[HttpActionSpec, ShellActionSpec]
+
+
+def _parse_http(action: Dict[str, Any]) -> HttpActionSpec:
+    return HttpActionSpec(
+        name=str(action.get("name") or ""),
+        method=(action.get("method") or "POST").upper(),
+        url=str(action.get("url") or ""),
+        headers=action.get("headers") or {},
+        json_body=action.get("json"),
+        data_body=action.get("data"),
+        params=action.get("params"),
+        body_is_text=bool(action.get("body_is_text", False)),
+    )
+
+
+def _parse_shell(action: Dict[str, Any]) -> ShellActionSpec:
+    return ShellActionSpec(
+        name=str(action.get("name") or ""),
+        command=str(action.get("command") or "").strip(),
+        args=tuple(action.get("args") or ()),
+        use_shell=bool(action.get("use_shell", False)),
+    )
+
+
+def parse_action(action: Dict[str, Any]) -> Optional[ActionSpec]:
+    """
+    Convert an action dict into its typed spec (coercions/defaults applied once).
+    Returns None for unsupported/missing types.
+    """
+    typ = (action.get("type") or "").lower()
+    if typ == "http":
+        return _parse_http(action)
+    if typ == "shell":
+        return _parse_shell(action)
+    return None
 
 
 @dataclass
@@ -28,34 +145,170 @@ class ActionContext:
     selection_type: str  # "clipboard" | "primary"
     settings_map: Optional[Dict[str, Dict[str, str]]] = None
     extra: Optional[Dict[str, Any]] = None
+    _flat: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _subst: Optional[Callable[[str], str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Flatten settings/extra once per context: {"config.sec.key": v, <extra keys>, "text": ...}
+        flat: Dict[str, str] = {
+            f"config.{sec}.{k}": v
+            for sec, kv in (self.settings_map or {}).items()
+            for k, v in kv.items()
+        }
+        if self.extra:
+            for k, v in self.extra.items():
+                flat[str(k)] = str(v)
+        flat["text"] = self.text or ""
+        self._flat = flat
+
+    def flat_table(self) -> Dict[str, str]:
+        """
+        Flattened placeholder table built at construction; lookups are O(1).
+        """
+        return self._flat
+
+    def substituter(self) -> Callable[[str], str]:
+        """
+        Return the string -> string expansion function for this context.
+        Compiled once and reused for every string leaf of an action.
+        """
+        if self._subst is None:
+            self._subst = _compile_substituter(self.flat_table())
+        return self._subst
+
+
+# {text}, {config.section.key}, {selection.type}, ... (section ids may contain '-').
+# Shared with config.expand_placeholders so every code path agrees on what a placeholder is.
+PLACEHOLDER_RE = re.compile(r"\{([A-Za-z0-9_.\-]+)\}")
+
+
+def _compile_substituter(table: Dict[str, str]) -> Callable[[str], str]:
+    lookup = table.get
+    finditer = PLACEHOLDER_RE.finditer
+
+    def _apply(s: str) -> str:
+        # fast path: literal strings (most headers, urls, args) need no regex scan
+        if "{" not in s:
+            return s
+        # single pass over the template, collecting slices and joining once;
+        # substituted values are never re-scanned for placeholders
+        parts: List[str] = []
+        last = 0
+        for m in finditer(s):
+            val = lookup(m.group(1))
+            if val is None:
+                continue  # unknown placeholders are left untouched
+            start, end = m.span()
+            parts.append(s[last:start])
+            parts.append(val)
+            last = end
+        if not parts:
+            return s
+        parts.append(s[last:])
+        return "".join(parts)
+
+    return _apply
 
 
 def _expand(s: str, ctx: ActionContext) -> str:
     if s is None:
         return s
-    out = s.replace("{text}", ctx.text or "")
-    # minimal config expansion
-    if ctx.settings_map:
-        for sec, kv in ctx.settings_map.items():
-            for k, v in kv.items():
-                out = out.replace(f"{{config.{sec}.{k}}}", v)
-    if ctx.extra:
-        for k, v in ctx.extra.items():
-            out = out.replace(f"{{{k}}}", str(v))
-    return out
+    return ctx.substituter()(s)
+
+
+# Identity-keyed memo: does a config-loaded sub-tree (headers, params, json, ...)
+# contain any placeholder? Action dicts are never mutated in place (edits reload
+# actions.json), and each entry keeps a reference to its object so ids stay valid.
+_LITERAL_CACHE: Dict[int, Tuple[Any, bool]] = {}
+_LITERAL_CACHE_LOCK = threading.Lock()
+_LITERAL_CACHE_MAX = 1024
+
+
+def _has_placeholder(obj: Any) -> bool:
+    if isinstance(obj, str):
+        return "{" in obj
+    if isinstance(obj, list):
+        return any(_has_placeholder(x) for x in obj)
+    if isinstance(obj, dict):
+        return any(_has_placeholder(v) for v in obj.values())
+    return False
+
+
+def _is_literal_tree(obj: Any) -> bool:
+    entry = _LITERAL_CACHE.get(id(obj))
+    if entry is not None and entry[0] is obj:
+        return entry[1]
+    literal = not _has_placeholder(obj)
+    with _LITERAL_CACHE_LOCK:
+        if len(_LITERAL_CACHE) >= _LITERAL_CACHE_MAX:
+            _LITERAL_CACHE.clear()
+        _LITERAL_CACHE[id(obj)] = (obj, literal)
+    return literal
+
+
+def clear_expand_cache() -> None:
+    """
+    Drop memoized sub-tree information (call after reloading actions).
+    """
+    with _LITERAL_CACHE_LOCK:
+        _LITERAL_CACHE.clear()
+        _JSON_BYTES_CACHE.clear()
 
 
 def _expand_recursive(obj: Any, ctx: ActionContext) -> Any:
+    return _expand_tree(obj, ctx.substituter())
+
+
+def _expand_tree(obj: Any, subst: Callable[[str], str]) -> Any:
+    # Placeholder-free containers are returned as-is instead of being rebuilt
+    if isinstance(obj, (list, dict)) and _is_literal_tree(obj):
+        return obj
+    return _expand_node(obj, subst)
+
+
+def _expand_node(obj: Any, subst: Callable[[str], str]) -> Any:
     if isinstance(obj, str):
-        return _expand(obj, ctx)
+        return subst(obj)
     if isinstance(obj, list):
-        return [_expand_recursive(x, ctx) for x in obj]
+        return [_expand_node(x, subst) for x in obj]
     if isinstance(obj, dict):
-        return {k: _expand_recursive(v, ctx) for k, v in obj.items()}
+        return {k: _expand_node(v, subst) for k, v in obj.items()}
     return obj
 
 
-def run_http_action(action: Dict[str, Any], ctx: ActionContext, timeout: float = 5.0) -> Tuple[bool, str]:
+# Serialized JSON bodies of placeholder-free actions, keyed like _LITERAL_CACHE
+_JSON_BYTES_CACHE: Dict[int, Tuple[Any, bytes]] = {}
+
+
+def _json_body_bytes(body: Any, literal: bool) -> bytes:
+    """
+    Serialize an (expanded) JSON body once. Literal bodies are the config objects
+    themselves, so their bytes are memoized by identity across runs.
+    """
+    if literal:
+        entry = _JSON_BYTES_CACHE.get(id(body))
+        if entry is not None and entry[0] is body:
+            return entry[1]
+    payload = jsonutil.dumps(body)
+    if literal:
+        with _LITERAL_CACHE_LOCK:
+            if len(_JSON_BYTES_CACHE) >= _LITERAL_CACHE_MAX:
+                _JSON_BYTES_CACHE.clear()
+            _JSON_BYTES_CACHE[id(body)] = (body, payload)
+    return payload
+
+
+def _with_json_content_type(headers: Dict[str, Any]) -> Dict[str, Any]:
+    for k in headers:
+        if str(k).lower() == "content-type":
+            return headers
+    # copy: headers may be the (shared) literal config dict
+    out = dict(headers)
+    out["Content-Type"] = "application/json"
+    return out
+
+
+def run_http_action(action: Union[Dict[str, Any], HttpActionSpec], ctx: ActionContext, timeout: float = 5.0) -> Tuple[bool, str]:
     """
     action dict schema (example):
     {
@@ -66,45 +319,103 @@ def run_http_action(action: Dict[str, Any], ctx: ActionContext, timeout: float =
       "json": {"cmd":"prompt","text":"{text}"}
     }
     """
-    if requests is None:
+    if _get_requests() is None:
         return False, "python-requests is not installed; install the 'http' extra"
 
-    method = (action.get("method") or "POST").upper()
-    url = str(action.get("url") or "")
+    spec = action if isinstance(action, HttpActionSpec) else _parse_http(action)
+    method = spec.method
+    url = spec.url
     if not url:
         return False, "http action missing url"
 
-    headers = action.get("headers") or {}
-    json_body = action.get("json")
-    data_body = action.get("data")
-    params = action.get("params")
-    body_is_text = bool(action.get("body_is_text", False))
-
-    # expand placeholders across fields
-    url = _expand(url, ctx)
-    headers = _expand_recursive(headers, ctx)
-    json_body = _expand_recursive(json_body, ctx)
-    data_body = _expand_recursive(data_body, ctx)
-    params = _expand_recursive(params, ctx)
+    headers = spec.headers
+    json_body = spec.json_body
+    data_body = spec.data_body
+    params = spec.params
+    body_is_text = spec.body_is_text
+
+    # expand placeholders across fields (substitution table is built once per ctx)
+    subst = ctx.substituter()
+    url = subst(url)
+    headers = _expand_tree(headers, subst)
+    raw_json = json_body
+    json_body = _expand_tree(json_body, subst)
+    data_body = _expand_tree(data_body, subst)
+    params = _expand_tree(params, subst)
     if method != "GET" and body_is_text and json_body is None and data_body is None:
         data_body = ctx.text
 
     try:
+        session = _get_http_session()
         if method == "GET":
-            r = requests.get(url, headers=headers, params=params, timeout=timeout)  # type: ignore[call-arg]
+            r = session.get(url, headers=headers, params=params, timeout=timeout)
         else:
             # Prefer JSON if provided; otherwise form data
             if json_body is not None:
-                r = requests.post(url, headers=headers, json=json_body, params=params, timeout=timeout)  # type: ignore[call-arg]
+                body = _json_body_bytes(json_body, literal=json_body is raw_json and isinstance(raw_json, (dict, list)))
+                r = session.post(url, headers=_with_json_content_type(headers), data=body, params=params, timeout=timeout)
             else:
-                r = requests.post(url, headers=headers, data=data_body, params=params, timeout=timeout)  # type: ignore[call-arg]
+                r = session.post(url, headers=headers, data=data_body, params=params, timeout=timeout)
         r.raise_for_status()
         return True, f"http {method} {url} -> {r.status_code}"
     except Exception as e:
         return False, str(e)
 
 
-def run_shell_action(action: Dict[str, Any], ctx: ActionContext) -> Tuple[bool, str]:
+# Upper bound for captured stdout/stderr per shell action (excess is discarded)
+SHELL_OUTPUT_CAP = 64 * 1024
+
+
+def _collect_bounded(
+    proc: "subprocess.Popen[bytes]", timeout: Optional[float], cap: int
+) -> Tuple[bytes, bool, bytes, bool]:
+    """
+    Drain proc's stdout/stderr until EOF, keeping at most `cap` bytes of each.
+    Pipes keep being drained past the cap so the child never blocks on a full pipe.
+    Returns (stdout, stdout_truncated, stderr, stderr_truncated).
+    timeout=None waits indefinitely; otherwise raises subprocess.TimeoutExpired.
+    """
+    bufs: Dict[int, bytearray] = {}
+    truncated: Dict[int, bool] = {}
+    sel = selectors.DefaultSelector()
+    try:
+        for f in (proc.stdout, proc.stderr):
+            if f is not None:
+                bufs[f.fileno()] = bytearray()
+                truncated[f.fileno()] = False
+                sel.register(f, selectors.EVENT_READ)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while sel.get_map():
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(proc.args, timeout)  # type: ignore[arg-type]
+            for key, _ in sel.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    continue
+                buf = bufs[key.fd]
+                room = cap - len(buf)
+                if room > 0:
+                    buf += chunk[:room]
+                if len(chunk) > room:
+                    truncated[key.fd] = True
+        proc.wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
+    finally:
+        sel.close()
+    out_fd = proc.stdout.fileno() if proc.stdout is not None else -1
+    err_fd = proc.stderr.fileno() if proc.stderr is not None else -1
+    return (
+        bytes(bufs.get(out_fd, b"")), truncated.get(out_fd, False),
+        bytes(bufs.get(err_fd, b"")), truncated.get(err_fd, False),
+    )
+
+
+def run_shell_action(
+    action: Union[Dict[str, Any], ShellActionSpec], ctx: ActionContext, timeout: Optional[float] = None
+) -> Tuple[bool, str]:
     """
     action dict schema (example):
     {
@@ -113,45 +424,128 @@ def run_shell_action(action: Dict[str, Any], ctx: ActionContext) -> Tuple[bool,
       "args": ["Selection Bridge", "Text: {text}"],
       "use_shell": false
     }
+
+    By default the command may run as long as it needs; pass `timeout` (seconds)
+    to kill it after that. Captured output is capped at SHELL_OUTPUT_CAP bytes per stream.
     """
-    cmd = str(action.get("command") or "").strip()
+    spec = action if isinstance(action, ShellActionSpec) else _parse_shell(action)
+    cmd = spec.command
     if not cmd:
         return False, "shell action missing command"
 
-    args = action.get("args") or []
-    use_shell = bool(action.get("use_shell", False))
+    args = spec.args
+    use_shell = spec.use_shell
 
     # expand placeholders
-    cmd = _expand(cmd, ctx)
-    args = [str(_expand(a, ctx)) for a in args]
+    subst = ctx.substituter()
+    cmd = subst(cmd)
+    args = [str(_expand_tree(a, subst)) for a in args]
 
     try:
         if use_shell:
-            # caller must provide correct quoting in 'command' field
-            full_cmd = cmd
-            if args:
-                # append expanded args for convenience
-                full_cmd = " ".join([cmd] + [shlex.quote(a) for a in args])
-            proc = subprocess.run(full_cmd, shell=True, capture_output=True, text=True)
+            # caller must provide correct quoting in 'command' field;
+            # expanded args are handed to the shell as positional parameters and
+            # appended via "$@" (no re-quoting/re-tokenizing of the values)
+            script = f'{cmd} "$@"' if args else cmd
+            proc = subprocess.Popen(["/bin/sh", "-c", script, "wbridge-shell", *args], shell=False,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         else:
-            proc = subprocess.run([cmd, *args], shell=False, capture_output=True, text=True)
+            proc = subprocess.Popen([cmd, *args], shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
+        with proc:
+            try:
+                out_b, out_cut, err_b, err_cut = _collect_bounded(proc, timeout, SHELL_OUTPUT_CAP)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                return False, f"timeout after {timeout:g}s"
+
+        out = out_b.decode("utf-8", errors="replace").strip()
+        err = err_b.decode("utf-8", errors="replace").strip()
+        if out_cut:
+            out = out and out + "...[truncated]"
+        if err_cut:
+            err = err and err + "...[truncated]"
         if proc.returncode == 0:
-            return True, proc.stdout.strip() or "ok"
+            return True, out or "ok"
         else:
-            err = proc.stderr.strip() or f"exit {proc.returncode}"
-            return False, err
+            return False, err or f"exit {proc.returncode}"
     except Exception as e:
         return False, str(e)
 
 
-def run_action(action: Dict[str, Any], ctx: ActionContext) -> Tuple[bool, str]:
+def run_action(
+    action: Union[Dict[str, Any], ActionSpec], ctx: ActionContext, shell_timeout: Optional[float] = None
+) -> Tuple[bool, str]:
     """
     Dispatch to the appropriate action runner.
+    Accepts a raw action dict or a spec pre-parsed with parse_action().
     """
-    typ = (action.get("type") or "").lower()
-    if typ == "http":
-        return run_http_action(action, ctx)
-    if typ == "shell":
-        return run_shell_action(action, ctx)
+    spec = action if isinstance(action, (HttpActionSpec, ShellActionSpec)) else parse_action(action)
+    if isinstance(spec, HttpActionSpec):
+        return run_http_action(spec, ctx)
+    if isinstance(spec, ShellActionSpec):
+        return run_shell_action(spec, ctx, timeout=shell_timeout)
+    typ = (action.get("type") or "").lower()  # type: ignore[union-attr]
     return False, f"unsupported action type: {typ or 'missing'}"
+
+
+# --------- Background execution ---------
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="wbridge-action")
+    return _EXECUTOR
+
+
+def run_action_async(action: Union[Dict[str, Any], ActionSpec], ctx: ActionContext) -> "Future[Tuple[bool, str]]":
+    """
+    Submit run_action to the shared worker pool and return its Future.
+    Use this from the GTK main thread so slow HTTP/shell actions never block the UI;
+    results must be marshalled back via GLib.idle_add.
+    """
+    return _get_executor().submit(run_action, action, ctx)
+
+
+def run_actions(actions: List[Union[Dict[str, Any], ActionSpec]], ctx: ActionContext) -> List[Tuple[bool, str]]:
+    """
+    Run several actions against the same context and return their results in order.
+    HTTP actions are dispatched concurrently on the worker pool; everything else runs
+    sequentially on the calling thread while those requests are in flight.
+    """
+    results: List[Tuple[bool, str]] = [(False, "not run")] * len(actions)
+    pending: Dict[int, "Future[Tuple[bool, str]]"] = {}
+    for i, action in enumerate(actions):
+        spec = action if isinstance(action, (HttpActionSpec, ShellActionSpec)) else parse_action(action)
+        if isinstance(spec, HttpActionSpec):
+            pending[i] = run_action_async(spec, ctx)
+    for i, action in enumerate(actions):
+        if i not in pending:
+            results[i] = run_action(action, ctx)
+    for i, fut in pending.items():
+        try:
+            results[i] = fut.result()
+        except Exception as e:
+            results[i] = (False, str(e))
+    return results
+
+
+def shutdown_action_executor() -> None:
+    """
+    Stop the worker pool (pending actions are cancelled). Safe to call multiple times.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        ex, _EXECUTOR = _EXECUTOR, None
+    if ex is not None:
+        try:
+            ex.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
@@ -15,8 +15,14 @@ Run:
     wbridge-app
 """
 
+import collections
+import logging
+import os
+import queue
 import sys
+import threading
 import time
+from typing import Callable
 
 try:
     import gi
@@ -36,9 +42,24 @@ from .ui.main_window import MainWindow as UIMainWindow
 from .history import HistoryStore
 from .selection_monitor import SelectionMonitor
 from .config import load_settings, load_actions
-from .actions import run_action, ActionContext
+from .actions import run_action, run_actions, ActionContext, close_http_session, shutdown_action_executor
 
 
+__all__ = ["BridgeApplication", "main"]
+
+
+_WHICH = frozenset(("clipboard", "primary"))
+
+
+def _which(req: dict) -> str:
+    """
+    Selection name from an IPC request. Canonical wire values are returned as-is;
+    anything else gets the legacy str().lower() normalization.
+    """
+    val = req.get("which", "clipboard")
+    if isinstance(val, str) and val in _WHICH:
+        return val
+    return str(val).lower()
 
 
 class BridgeApplication(Gtk.Application):
@@ -48,11 +69,34 @@ class BridgeApplication(Gtk.Application):
         self._logger = setup_logging()
         self._ipc: IPCServer | None = None
         self._display: object | None = None
-        self._providers: list = []
+        self._text_formats: object | None = None
+        # Current content provider per selection ("clipboard"/"primary"); only the owner must stay alive
+        self._providers: dict[str, object] = {}
+        # Latest pending selection write per "which"; one idle callback drains each slot
+        self._pending_set: dict[str, str] = {}
+        self._pending_set_lock = threading.Lock()
+        # Main-thread work posted from other threads; drained together in one idle tick
+        self._main_queue: collections.deque = collections.deque()
+        self._main_queue_scheduled = False
+        self._main_queue_lock = threading.Lock()
         self._history: HistoryStore = HistoryStore()
         self._monitor: SelectionMonitor | None = None
         self._settings = None
         self._actions = None
+        # IPC op -> handler (dispatch table for _ipc_handler); keys are interned,
+        # as are the op names IPCServer hands in
+        ops: dict[str, Callable[[dict], dict]] = {
+            "ui.show": self._op_ui_show,
+            "selection.set": self._op_selection_set,
+            "selection.get": self._op_selection_get,
+            "history.list": self._op_history_list,
+            "history.apply": self._op_history_apply,
+            "history.swap": self._op_history_swap,
+            "action.run": self._op_action_run,
+            "action.run_batch": self._op_action_run_batch,
+            "trigger": self._op_trigger,
+        }
+        self._ops = {sys.intern(k): v for k, v in ops.items()}
 
     def do_startup(self) -> None:
         # Explicitly chain to Gtk.Application to avoid GI binding quirks
@@ -104,6 +148,8 @@ class BridgeApplication(Gtk.Application):
                 self._monitor.stop()
         except Exception as e:
             self._logger.exception("Selection monitor stop error: %s", e)
+        shutdown_action_executor()
+        close_http_session()
         # Chain correctly to Gtk.Application (avoid GI TypeError)
         Gtk.Application.do_shutdown(self)
 
@@ -144,9 +190,33 @@ class BridgeApplication(Gtk.Application):
                 self._logger.exception("bring_to_front error: %s", e)
             return False
         # schedule on main thread
-        GLib.idle_add(_present, priority=GLib.PRIORITY_DEFAULT)  # type: ignore
+        self._post(_present)
+
+    def _post(self, fn: Callable, *args) -> None:
+        """
+        Run fn(*args) on the GTK main thread. Calls posted before the next idle
+        tick are drained together by a single GLib idle callback, in order.
+        """
+        with self._main_queue_lock:
+            self._main_queue.append((fn, args))
+            if self._main_queue_scheduled:
+                return
+            self._main_queue_scheduled = True
+        GLib.idle_add(self._drain_main_queue, priority=GLib.PRIORITY_DEFAULT)  # type: ignore
+
+    def _drain_main_queue(self) -> bool:
+        with self._main_queue_lock:
+            pending = list(self._main_queue)
+            self._main_queue.clear()
+            self._main_queue_scheduled = False
+        for fn, args in pending:
+            try:
+                fn(*args)
+            except Exception as e:
+                self._logger.exception("main-thread callback error: %s", e)
+        return False
 
-    # Helper methods (run on main thread via GLib.idle_add when needed)
+    # Helper methods (run on main thread via _post when needed)
     def _ensure_display(self) -> object:
         if self._display is None:
             try:
@@ -155,6 +225,15 @@ class BridgeApplication(Gtk.Application):
                 self._display = None
         return self._display
 
+    def _ensure_text_formats(self) -> object | None:
+        # Parsed once; reused by the bytes-provider fallback in _set_selection_mainthread
+        if self._text_formats is None:
+            try:
+                self._text_formats = Gdk.ContentFormats.parse("text/plain;charset=utf-8")
+            except Exception:
+                self._text_formats = None
+        return self._text_formats
+
     def _set_selection_mainthread(self, which: str, text: str) -> None:
         disp = self._ensure_display()
         try:
@@ -179,16 +258,10 @@ class BridgeApplication(Gtk.Application):
                     b = GLib.Bytes.new(text.encode("utf-8"))  # type: ignore[attr-defined]
                 except Exception:
                     b = GLib.Bytes(text.encode("utf-8"))  # type: ignore
-                try:
-                    formats = Gdk.ContentFormats.parse("text/plain;charset=utf-8")
-                except Exception:
-                    formats = None
+                formats = self._ensure_text_formats()
                 provider = Gdk.ContentProvider.new_for_bytes(formats or "text/plain", b)
-            # Keep provider alive until next ownership change
-            try:
-                self._providers.append(provider)  # type: ignore[name-defined]
-            except Exception:
-                pass
+            # Keep provider alive until next ownership change (replaces the previous one)
+            self._providers[which] = provider
             if hasattr(clip, "set_content"):
                 clip.set_content(provider)  # type: ignore[attr-defined]
             else:
@@ -196,13 +269,30 @@ class BridgeApplication(Gtk.Application):
         except Exception as e:
             self._logger.exception("set_selection error: %s", e)
 
+    def _queue_set(self, which: str, text: str) -> None:
+        """
+        Request a selection write from any thread. Rapid successive writes to the
+        same selection are coalesced: only the latest text is applied.
+        """
+        with self._pending_set_lock:
+            scheduled = which in self._pending_set
+            self._pending_set[which] = text
+        if not scheduled:
+            self._post(self._drain_set, which)
+
+    def _drain_set(self, which: str) -> None:
+        with self._pending_set_lock:
+            text = self._pending_set.pop(which, None)
+        if text is not None:
+            self._set_selection_mainthread(which, text)
+
     def _get_selection_blocking(self, which: str, timeout_ms: int = 1000) -> str:
         """
         Schedule an async read on the GTK main thread and wait for completion.
         Returns empty string on timeout/error.
         """
-        result = {"text": ""}
-        done = {"flag": False}
+        # Single-item handoff from the GTK thread to this (IPC) thread
+        result: "queue.SimpleQueue[str]" = queue.SimpleQueue()
 
         def _start_read():
             try:
@@ -214,27 +304,25 @@ class BridgeApplication(Gtk.Application):
 
                 def _on_finish(source, res):
                     try:
-                        txt = source.read_text_finish(res)
-                        result["text"] = txt or ""
+                        txt = source.read_text_finish(res) or ""
                     except Exception:
-                        result["text"] = ""
-                    finally:
-                        done["flag"] = True
+                        txt = ""
+                    result.put(txt)
                     return False
 
                 clip.read_text_async(None, _on_finish)  # type: ignore[arg-type]
             except Exception:
-                done["flag"] = True
+                result.put("")
             return False
 
-        GLib.idle_add(_start_read, priority=GLib.PRIORITY_DEFAULT)  # type: ignore
-        # Busy-wait with small sleeps; GLib timeout in a separate thread is fine for V1.
-        waited = 0
-        step = 0.01
-        while not done["flag"] and waited < timeout_ms / 1000.0:
-            GLib.usleep(int(step * 1_000_000))
-            waited += step
-        return result["text"]
+        # Dispatch onto the default main context ahead of regular idle work;
+        # the finish callback wakes the waiter below directly.
+        GLib.MainContext.default().invoke_full(GLib.PRIORITY_HIGH, _start_read)  # type: ignore
+        # Wait (off the main thread) until the async read completes or times out.
+        try:
+            return result.get(timeout=timeout_ms / 1000.0)
+        except queue.Empty:
+            return ""
 
     def _resolve_source_text(self, source: dict, text: str | None) -> tuple[str, str]:
         """
@@ -260,6 +348,22 @@ class BridgeApplication(Gtk.Application):
             sel_type = "clipboard"
         return sel_text, sel_type
 
+    def _current_settings_map(self) -> dict | None:
+        """
+        Settings map for action placeholders. load_settings() only re-parses
+        settings.ini when the file changed, and as_mapping() is memoized.
+        """
+        try:
+            self._settings = load_settings()
+        except Exception:
+            pass
+        if self._settings is None:
+            return None
+        try:
+            return self._settings.as_mapping()  # type: ignore[union-attr]
+        except Exception:
+            return None
+
     # Monitor callback: update history when selections change
     def _on_selection_change(self, which: str, text: str) -> None:
         try:
@@ -268,175 +372,233 @@ class BridgeApplication(Gtk.Application):
             else:
                 self._history.add_primary(text)
             # TODO: future - notify UI model to refresh list views
-            self._logger.debug("History updated (%s): %s", which, text[:60].replace("\n", " "))
+            # runs on every selection change; only build the preview when debug is on
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("History updated (%s): %s", which, text[:60].replace("\n", " "))
         except Exception as e:
             self._logger.exception("History update error: %s", e)
 
     # ------------- IPC handler -------------
     def _ipc_handler(self, req: dict) -> dict:
         """
-        Minimal handler for early scaffold. Supports:
-          - {"op":"ui.show"}  -> present the window and return ok
-        Other ops return "INVALID_OP" for now.
+        Dispatch an IPC request to its op handler (see self._ops).
+        Unknown ops return "INVALID_OP".
         """
         try:
             op = str(req.get("op", ""))
         except Exception:
             return {"ok": False, "error": "op missing", "code": "INVALID_ARG"}
 
-        if op == "ui.show":
-            # Present window on the GTK main thread (debounced inside bring_to_front)
-            try:
-                self.bring_to_front()
-                try:
-                    self._logger.info("ui.show scheduled")
-                except Exception:
-                    pass
-            except Exception as e:
-                self._logger.exception("ui.show error: %s", e)
-            return {"ok": True, "data": {"op": "ui.show"}}
-
-        if op == "selection.set":
-            which = str(req.get("which", "clipboard")).lower()
-            text = str(req.get("text", ""))
-            # Run on main thread and wait briefly for it to be scheduled
-            GLib.idle_add(self._set_selection_mainthread, which, text, priority=GLib.PRIORITY_DEFAULT)  # type: ignore
-            return {"ok": True, "data": {"op": "selection.set", "which": which, "len": len(text)}}
-
-        if op == "selection.get":
-            which = str(req.get("which", "clipboard")).lower()
-            txt = self._get_selection_blocking(which)
-            return {"ok": True, "data": {"op": "selection.get", "which": which, "text": txt}}
-
-        if op == "history.list":
-            which = str(req.get("which", "clipboard")).lower()
-            limit_val = req.get("limit", None)
-            limit = None
-            if limit_val is not None:
-                try:
-                    limit = int(limit_val)
-                except Exception:
-                    return {"ok": False, "error": "limit must be an integer", "code": "INVALID_ARG"}
-            items = self._history.list(which, limit=limit)
-            return {"ok": True, "data": {"op": "history.list", "which": which, "items": items}}
+        handler = self._ops.get(op)
+        if handler is None:
+            return {"ok": False, "error": f"unsupported op: {op}", "code": "INVALID_OP"}
+        return handler(req)
 
-        if op == "history.apply":
-            which = str(req.get("which", "clipboard")).lower()
-            try:
-                index = int(req.get("index", 0))
-            except Exception:
-                return {"ok": False, "error": "index must be an integer", "code": "INVALID_ARG"}
-            text = self._history.get(which, index)
-            if text is None:
-                return {"ok": False, "error": "history index not found", "code": "NOT_FOUND"}
-            # Apply on GTK main thread
-            GLib.idle_add(self._set_selection_mainthread, which, text, priority=GLib.PRIORITY_DEFAULT)  # type: ignore
-            return {"ok": True, "data": {"op": "history.apply", "which": which, "index": index, "len": len(text)}}
-
-        if op == "history.swap":
-            which = str(req.get("which", "clipboard")).lower()
-            swapped = self._history.swap_last_two(which)
-            if not swapped:
-                return {"ok": False, "error": "not enough history items to swap", "code": "NOT_FOUND"}
-            # After swap, apply the new top item to effect a 'toggle'
-            top = self._history.get(which, 0) or ""
-            if top:
-                GLib.idle_add(self._set_selection_mainthread, which, top, priority=GLib.PRIORITY_DEFAULT)  # type: ignore
-            return {"ok": True, "data": {"op": "history.swap", "which": which, "applied": bool(top), "len": len(top)}}
-
-        if op == "action.run":
-            name = str(req.get("name", "")).strip()
-            if not name:
-                return {"ok": False, "error": "name is required", "code": "INVALID_ARG"}
-            src = req.get("source") or {}
-            text_override = req.get("text")
-
-            actions_cfg = getattr(self, "_actions", None)
-            actions_list = getattr(actions_cfg, "actions", []) if actions_cfg else []
-            if not actions_list:
-                return {"ok": False, "error": "no actions configured", "code": "NOT_FOUND"}
-            action = next((a for a in actions_list if a.get("name") == name), None)
-            if not action:
-                return {"ok": False, "error": f"action not found: {name}", "code": "NOT_FOUND"}
-
-            # If no explicit source provided, prefer explicit text override, else action.default_source (then fallback remains clipboard in resolver).
-            try:
-                if not src:
-                    if text_override is not None:
-                        src = {"from": "text"}
-                    else:
-                        ds = str(action.get("default_source", "")).lower()
-                        if ds in ("clipboard", "primary", "text"):
-                            src = {"from": ds}
-            except Exception:
-                pass
-
-            sel_text, sel_type = self._resolve_source_text(src, text_override)
-            # V2: reload settings fresh on each action to reflect edits (endpoints/secrets/shortcuts)
+    def _op_ui_show(self, req: dict) -> dict:
+        # Present window on the GTK main thread (debounced inside bring_to_front)
+        try:
+            self.bring_to_front()
             try:
-                self._settings = load_settings()
+                self._logger.info("ui.show scheduled")
             except Exception:
                 pass
+        except Exception as e:
+            self._logger.exception("ui.show error: %s", e)
+        return {"ok": True, "data": {"op": "ui.show"}}
+
+    def _op_selection_set(self, req: dict) -> dict:
+        which = _which(req)
+        text = str(req.get("text", ""))
+        # Run on main thread (coalesced with any still-pending write)
+        self._queue_set(which, text)
+        return {"ok": True, "data": {"op": "selection.set", "which": which, "len": len(text)}}
+
+    def _op_selection_get(self, req: dict) -> dict:
+        which = _which(req)
+        txt = self._get_selection_blocking(which)
+        return {"ok": True, "data": {"op": "selection.get", "which": which, "text": txt}}
+
+    def _op_history_list(self, req: dict) -> dict:
+        which = _which(req)
+        limit_val = req.get("limit", None)
+        limit = None
+        if limit_val is not None:
             try:
-                settings_map = self._settings.as_mapping() if self._settings else None  # type: ignore[union-attr]
+                limit = int(limit_val)
             except Exception:
-                settings_map = None
-            ctx = ActionContext(text=sel_text, selection_type=sel_type, settings_map=settings_map, extra={"selection.type": sel_type})
+                return {"ok": False, "error": "limit must be an integer", "code": "INVALID_ARG"}
+        items = self._history.list(which, limit=limit)
+        return {"ok": True, "data": {"op": "history.list", "which": which, "items": items}}
 
-            # Logging: start + source
-            try:
-                start = time.monotonic()
-                src_from = None
-                try:
-                    if isinstance(src, dict):
-                        src_from = src.get("from")
-                    else:
-                        src_from = src
-                except Exception:
-                    src_from = None
-                self._logger.info("action.run start name=%s source=%s", name, src_from)
-            except Exception:
-                start = time.monotonic()
+    def _op_history_apply(self, req: dict) -> dict:
+        which = _which(req)
+        try:
+            index = int(req.get("index", 0))
+        except Exception:
+            return {"ok": False, "error": "index must be an integer", "code": "INVALID_ARG"}
+        text = self._history.get(which, index)
+        if text is None:
+            return {"ok": False, "error": "history index not found", "code": "NOT_FOUND"}
+        # Apply on GTK main thread
+        self._queue_set(which, text)
+        return {"ok": True, "data": {"op": "history.apply", "which": which, "index": index, "len": len(text)}}
+
+    def _op_history_swap(self, req: dict) -> dict:
+        which = _which(req)
+        swapped = self._history.swap_last_two(which)
+        if not swapped:
+            return {"ok": False, "error": "not enough history items to swap", "code": "NOT_FOUND"}
+        # After swap, apply the new top item to effect a 'toggle'
+        top = self._history.get(which, 0) or ""
+        if top:
+            self._queue_set(which, top)
+        return {"ok": True, "data": {"op": "history.swap", "which": which, "applied": bool(top), "len": len(top)}}
+
+    def _op_action_run(self, req: dict) -> dict:
+        name = str(req.get("name", "")).strip()
+        if not name:
+            return {"ok": False, "error": "name is required", "code": "INVALID_ARG"}
+        return self._run_action_by_name(name, req.get("source"), req.get("text"))
+
+    @staticmethod
+    def _effective_source(action: dict, src: dict, text_override: str | None) -> dict:
+        """
+        If no explicit source provided, prefer explicit text override, else
+        action.default_source (then fallback remains clipboard in resolver).
+        """
+        try:
+            if not src:
+                if text_override is not None:
+                    return {"from": "text"}
+                ds = str(action.get("default_source", "")).lower()
+                if ds in ("clipboard", "primary", "text"):
+                    return {"from": ds}
+        except Exception:
+            pass
+        return src
 
-            ok, message = run_action(action, ctx)
-            elapsed = int((time.monotonic() - start) * 1000)
+    def _run_action_by_name(self, name: str, source: dict | None, text_override: str | None) -> dict:
+        """
+        Shared body of the action.run and trigger ops.
+        """
+        src = source or {}
+
+        actions_cfg = getattr(self, "_actions", None)
+        actions_list = getattr(actions_cfg, "actions", []) if actions_cfg else []
+        if not actions_list:
+            return {"ok": False, "error": "no actions configured", "code": "NOT_FOUND"}
+        by_name = getattr(actions_cfg, "by_name", None)
+        if by_name is None:
+            by_name = {a.get("name"): a for a in actions_list}
+        action = by_name.get(name)
+        if not action:
+            return {"ok": False, "error": f"action not found: {name}", "code": "NOT_FOUND"}
+
+        src = self._effective_source(action, src, text_override)
+
+        sel_text, sel_type = self._resolve_source_text(src, text_override)
+        # V2: pick up settings edits (endpoints/secrets/shortcuts); re-read only when changed
+        settings_map = self._current_settings_map()
+        ctx = ActionContext(text=sel_text, selection_type=sel_type, settings_map=settings_map, extra={"selection.type": sel_type})
+
+        # Logging: start + source
+        try:
+            start = time.monotonic()
+            src_from = None
             try:
-                l = len(sel_text or "")
-                if ok:
-                    self._logger.info("action.run ok name=%s sel_type=%s len=%d elapsed_ms=%d", name, sel_type, l, elapsed)
+                if isinstance(src, dict):
+                    src_from = src.get("from")
                 else:
-                    self._logger.warning("action.run failed name=%s sel_type=%s len=%d elapsed_ms=%d error=%s", name, sel_type, l, elapsed, message)
+                    src_from = src
             except Exception:
-                pass
+                src_from = None
+            self._logger.info("action.run start name=%s source=%s", name, src_from)
+        except Exception:
+            start = time.monotonic()
 
+        # Prefer the spec parsed at load time; fall back to the raw dict
+        specs = getattr(actions_cfg, "specs", None) or {}
+        ok, message = run_action(specs.get(name) or action, ctx)
+        elapsed = int((time.monotonic() - start) * 1000)
+        try:
+            l = len(sel_text or "")
             if ok:
-                return {"ok": True, "data": {"op": "action.run", "name": name, "result": message}}
+                self._logger.info("action.run ok name=%s sel_type=%s len=%d elapsed_ms=%d", name, sel_type, l, elapsed)
             else:
-                return {"ok": False, "error": message, "code": "ACTION_FAILED"}
-
-        if op == "trigger":
-            cmd = str(req.get("cmd", "")).strip()
-            if not cmd:
-                return {"ok": False, "error": "cmd is required", "code": "INVALID_ARG"}
-            actions_cfg = getattr(self, "_actions", None)
-            triggers = getattr(actions_cfg, "triggers", {}) if actions_cfg else {}
-            if not triggers:
-                return {"ok": False, "error": "no triggers configured", "code": "NOT_FOUND"}
-            target_name = triggers.get(cmd)
-            if not target_name:
-                return {"ok": False, "error": f"trigger not found: {cmd}", "code": "NOT_FOUND"}
-            try:
-                self._logger.info("trigger received cmd=%s -> action=%s", cmd, target_name)
-            except Exception:
-                pass
-            # reuse action.run path
-            sub_req = dict(req)
-            sub_req["op"] = "action.run"
-            sub_req["name"] = target_name
-            return self._ipc_handler(sub_req)
-
-        return {"ok": False, "error": f"unsupported op: {op}", "code": "INVALID_OP"}
-        
+                self._logger.warning("action.run failed name=%s sel_type=%s len=%d elapsed_ms=%d error=%s", name, sel_type, l, elapsed, message)
+        except Exception:
+            pass
+
+        if ok:
+            return {"ok": True, "data": {"op": "action.run", "name": name, "result": message}}
+        else:
+            return {"ok": False, "error": message, "code": "ACTION_FAILED"}
+
+    def _op_action_run_batch(self, req: dict) -> dict:
+        names_val = req.get("names")
+        if not isinstance(names_val, list) or not names_val:
+            return {"ok": False, "error": "names must be a non-empty list", "code": "INVALID_ARG"}
+        names = [str(n).strip() for n in names_val]
+        src = req.get("source") or {}
+        text_override = req.get("text")
+
+        actions_cfg = getattr(self, "_actions", None)
+        actions_list = getattr(actions_cfg, "actions", []) if actions_cfg else []
+        by_name = getattr(actions_cfg, "by_name", None)
+        if by_name is None:
+            by_name = {a.get("name"): a for a in actions_list}
+        missing = [n for n in names if n not in by_name]
+        if missing:
+            return {"ok": False, "error": f"action not found: {', '.join(missing)}", "code": "NOT_FOUND"}
+
+        # Source per action exactly as action.run resolves it; each distinct source is
+        # read once and actions sharing it run together against one context
+        settings_map = self._current_settings_map()
+        specs = getattr(actions_cfg, "specs", None) or {}
+        groups: dict[tuple, list[int]] = {}
+        group_src: dict[tuple, dict] = {}
+        for i, n in enumerate(names):
+            eff = self._effective_source(by_name[n], src, text_override)
+            key = tuple(sorted((str(k), str(v)) for k, v in eff.items())) if isinstance(eff, dict) else (str(eff),)
+            groups.setdefault(key, []).append(i)
+            group_src.setdefault(key, eff)
+
+        start = time.monotonic()
+        results: list[tuple[bool, str]] = [(False, "not run")] * len(names)
+        for key, idxs in groups.items():
+            sel_text, sel_type = self._resolve_source_text(group_src[key], text_override)
+            ctx = ActionContext(text=sel_text, selection_type=sel_type, settings_map=settings_map, extra={"selection.type": sel_type})
+            for i, res in zip(idxs, run_actions([specs.get(names[i]) or by_name[names[i]] for i in idxs], ctx)):
+                results[i] = res
+        elapsed = int((time.monotonic() - start) * 1000)
+        all_ok = all(ok for ok, _ in results)
+        try:
+            self._logger.info("action.run_batch names=%s ok=%s elapsed_ms=%d", ",".join(names), all_ok, elapsed)
+        except Exception:
+            pass
+        items = [{"name": n, "ok": ok, "result": msg} for n, (ok, msg) in zip(names, results)]
+        if all_ok:
+            return {"ok": True, "data": {"op": "action.run_batch", "results": items}}
+        return {"ok": False, "error": "one or more actions failed", "code": "ACTION_FAILED", "data": {"op": "action.run_batch", "results": items}}
+
+    def _op_trigger(self, req: dict) -> dict:
+        cmd = str(req.get("cmd", "")).strip()
+        if not cmd:
+            return {"ok": False, "error": "cmd is required", "code": "INVALID_ARG"}
+        actions_cfg = getattr(self, "_actions", None)
+        triggers = getattr(actions_cfg, "triggers", {}) if actions_cfg else {}
+        if not triggers:
+            return {"ok": False, "error": "no triggers configured", "code": "NOT_FOUND"}
+        target_name = triggers.get(cmd)
+        if not target_name:
+            return {"ok": False, "error": f"trigger not found: {cmd}", "code": "NOT_FOUND"}
+        try:
+            self._logger.info("trigger received cmd=%s -> action=%s", cmd, target_name)
+        except Exception:
+            pass
+        # run the mapped action directly (no synthetic action.run request)
+        return self._run_action_by_name(str(target_name).strip(), req.get("source"), req.get("text"))
+
 
 def main(argv=None) -> int:
     app = BridgeApplication()
@@ -33,20 +33,29 @@ def is_enabled() -> bool:
         return False
 
 
-def enable() -> bool:
+def enable(durable: bool = False) -> bool:
     """
     Create/overwrite the autostart desktop file atomically.
+    Nothing is written if the file already has the expected content.
+    With durable=True the data is fsync'ed before the rename; by default this is
+    skipped (the file is small, idempotent and simply re-created by enabling again).
     Returns True on success, False otherwise.
     """
     tmp: Optional[Path] = None
     try:
         ensure_dirs()
         p = autostart_desktop_path()
+        try:
+            if p.read_text(encoding="utf-8") == DESKTOP_CONTENT:
+                return True
+        except OSError:
+            pass
         tmp = p.parent / (p.name + ".tmp")
         with tmp.open("w", encoding="utf-8") as f:
             f.write(DESKTOP_CONTENT)
-            f.flush()
-            os.fsync(f.fileno())
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
         os.replace(tmp, p)
         return True
     except Exception:
@@ -9,6 +9,7 @@ Subcommands:
   - selection get/set
   - history list/apply/swap
   - trigger (alias for action mapped on the server) or run a named action
+  - batch (newline-delimited JSON requests from stdin over one connection)
 
 Exit codes:
   0: success
@@ -20,26 +21,38 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
-import json
+import contextlib
+import io
 import sys
 import os
 import shutil
-from datetime import datetime
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
+from . import jsonutil
 from .platform import xdg_config_dir, xdg_state_dir, autostart_desktop_path
-from . import gnome_shortcuts, autostart
-
-from .client_ipc import send_request, cli_exit_code_from_response
-from .profiles_manager import (
-    list_builtin_profiles as profiles_list,
-    show_profile as profiles_show,
-    install_profile as profiles_install,
-    remove_profile_shortcuts,
+
+# profiles_manager, gnome_shortcuts and autostart are imported inside the commands
+# that use them, so IPC commands (selection/history/trigger) start up lighter.
+from .client_ipc import (
+    send_request,
+    open_connection,
+    send_on,
+    transport_error,
+    cli_exit_code_from_response,
 )
 
 
+
+def _dumps(data: Any) -> str:
+    """
+    Render JSON output: indented for a terminal, compact when piped (scripts/shortcuts).
+    """
+    return jsonutil.dumps(data, indent=sys.stdout.isatty()).decode("utf-8")
+
+
 def _print_response(ok: bool, resp: Dict[str, Any]) -> int:
     code = cli_exit_code_from_response(ok, resp)
     if ok:
@@ -49,7 +62,7 @@ def _print_response(ok: bool, resp: Dict[str, Any]) -> int:
         else:
             # pretty-print data if present
             try:
-                print(json.dumps(data, ensure_ascii=False, indent=2))
+                print(_dumps(data))
             except Exception:
                 print(str(data))
     else:
@@ -129,11 +142,21 @@ def _source_from_args(args: argparse.Namespace):
 def cmd_trigger(args: argparse.Namespace) -> int:
     source = _source_from_args(args)
     req: Dict[str, Any]
-    if args.name:
+    if args.name and len(args.name) > 1:
+        # Several named actions in one request (selection read once per source)
+        req = {
+            "op": "action.run_batch",
+            "names": args.name
+        }
+        if source is not None:
+            req["source"] = source
+        if args.text is not None:
+            req["text"] = args.text
+    elif args.name:
         # Run a named action directly
         req = {
             "op": "action.run",
-            "name": args.name
+            "name": args.name[0]
         }
         if source is not None:
             req["source"] = source
@@ -156,10 +179,45 @@ def cmd_trigger(args: argparse.Namespace) -> int:
     return _print_response(ok, resp)
 
 
+def cmd_batch(_args: argparse.Namespace) -> int:
+    """
+    Read one JSON request per stdin line, send all of them over a single
+    connection and print one JSON response per line. Returns the highest
+    exit code seen.
+    """
+    worst = 0
+    try:
+        conn = open_connection()
+    except Exception as e:
+        return _print_response(*transport_error(e))
+    with conn:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                req = jsonutil.loads(line)
+                if not isinstance(req, dict):
+                    raise ValueError("request must be a JSON object")
+            except Exception as e:
+                print(f"invalid request: {e}", file=sys.stderr)
+                worst = max(worst, 2)
+                continue
+            try:
+                ok, resp = send_on(conn, req)
+            except Exception as e:
+                # Connection is unusable; stop here
+                return max(worst, _print_response(*transport_error(e)))
+            print(_dumps(resp))
+            worst = max(worst, cli_exit_code_from_response(ok, resp))
+    return worst
+
+
 def cmd_profile_list(_args: argparse.Namespace) -> int:
     try:
+        from .profiles_manager import list_builtin_profiles as profiles_list
         names = profiles_list()
-        print(json.dumps(names, ensure_ascii=False, indent=2))
+        print(_dumps(names))
         return 0
     except Exception as e:
         print(str(e), file=sys.stderr)
@@ -172,8 +230,9 @@ def cmd_profile_show(args: argparse.Namespace) -> int:
         print("--name is required", file=sys.stderr)
         return 2
     try:
+        from .profiles_manager import show_profile as profiles_show
         res = profiles_show(name)
-        print(json.dumps(res, ensure_ascii=False, indent=2))
+        print(_dumps(res))
         return 0 if res.get("ok") else 3
     except Exception as e:
         print(str(e), file=sys.stderr)
@@ -186,6 +245,7 @@ def cmd_profile_install(args: argparse.Namespace) -> int:
         print("--name is required", file=sys.stderr)
         return 2
     try:
+        from .profiles_manager import install_profile as profiles_install
         report = profiles_install(
             name,
             overwrite_actions=bool(args.overwrite_actions),
@@ -194,7 +254,7 @@ def cmd_profile_install(args: argparse.Namespace) -> int:
             merge_shortcuts=bool(args.merge_shortcuts),
             dry_run=bool(args.dry_run),
         )
-        print(json.dumps(report, ensure_ascii=False, indent=2))
+        print(_dumps(report))
         return 0 if report.get("ok") else 3
     except Exception as e:
         print(str(e), file=sys.stderr)
@@ -203,7 +263,9 @@ def cmd_profile_install(args: argparse.Namespace) -> int:
 
 # ------------- Config CLI helpers -------------
 
+@lru_cache(maxsize=1)
 def _config_paths() -> Dict[str, str]:
+    # Environment-derived and fixed for the life of a CLI process; callers must not mutate
     cfg = xdg_config_dir()
     return {
         "settings": str(cfg / "settings.ini"),
@@ -216,7 +278,7 @@ def _config_paths() -> Dict[str, str]:
 def cmd_config_show_paths(args: argparse.Namespace) -> int:
     paths = _config_paths()
     if getattr(args, "json", False):
-        print(json.dumps(paths, ensure_ascii=False, indent=2))
+        print(_dumps(paths))
     else:
         for k, v in paths.items():
             print(f"{k}: {v}")
@@ -224,7 +286,7 @@ def cmd_config_show_paths(args: argparse.Namespace) -> int:
 
 
 def _timestamp() -> str:
-    return datetime.now().strftime("%Y%m%d-%H%M%S")
+    return time.strftime("%Y%m%d-%H%M%S")
 
 
 def _backup_file(path: Path) -> Path:
@@ -307,9 +369,13 @@ def cmd_config_restore(args: argparse.Namespace) -> int:
             else:
                 tgt = Path(paths["actions"])
         tgt.parent.mkdir(parents=True, exist_ok=True)
-        tmp = tgt.parent / (tgt.name + ".tmp")
-        shutil.copy2(src, tmp)
-        os.replace(tmp, tgt)
+        if getattr(args, "move", False) and os.stat(src).st_dev == os.stat(tgt.parent).st_dev:
+            # Consume the backup: a single rename, no data copied
+            os.replace(src, tgt)
+        else:
+            tmp = tgt.parent / (tgt.name + ".tmp")
+            shutil.copy2(src, tmp)
+            os.replace(tmp, tgt)
         print(f"restored into: {tgt}")
         return 0
     except Exception as e:
@@ -327,8 +393,9 @@ def cmd_profile_uninstall(args: argparse.Namespace) -> int:
         print("profile uninstall currently supports only --shortcuts-only", file=sys.stderr)
         return 2
     try:
+        from .profiles_manager import remove_profile_shortcuts
         rep = remove_profile_shortcuts(name)
-        print(json.dumps({"ok": True, "name": name, "report": rep}, ensure_ascii=False, indent=2))
+        print(_dumps({"ok": True, "name": name, "report": rep}))
         return 0
     except Exception as e:
         print(str(e), file=sys.stderr)
@@ -340,6 +407,7 @@ def cmd_shortcuts_remove(args: argparse.Namespace) -> int:
         print("specify --recommended to remove recommended shortcuts", file=sys.stderr)
         return 2
     try:
+        from . import gnome_shortcuts
         gnome_shortcuts.remove_recommended_shortcuts()
         print("OK: recommended shortcuts removed")
         return 0
@@ -350,6 +418,7 @@ def cmd_shortcuts_remove(args: argparse.Namespace) -> int:
 
 def cmd_autostart_disable(_args: argparse.Namespace) -> int:
     try:
+        from . import autostart
         ok = autostart.disable()
         print("OK" if ok else "FAILED")
         return 0 if ok else 3
@@ -358,17 +427,14 @@ def cmd_autostart_disable(_args: argparse.Namespace) -> int:
         return 1
 
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(prog="wbridge", description="Selection/Shortcut Bridge CLI")
-    sub = p.add_subparsers(dest="sub")
-
-    # ui show
+def _add_ui_parser(sub) -> None:
     p_ui = sub.add_parser("ui", help="UI commands")
     sub_ui = p_ui.add_subparsers(dest="sub_ui")
     p_ui_show = sub_ui.add_parser("show", help="bring the GUI window to the foreground")
     p_ui_show.set_defaults(func=cmd_ui_show)
 
-    # selection
+
+def _add_selection_parser(sub) -> None:
     p_sel = sub.add_parser("selection", help="selection operations")
     sub_sel = p_sel.add_subparsers(dest="sub_sel")
 
@@ -381,7 +447,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_sel_set.add_argument("--text", required=True, help="literal text to set")
     p_sel_set.set_defaults(func=cmd_selection_set)
 
-    # history
+
+def _add_history_parser(sub) -> None:
     p_hist = sub.add_parser("history", help="history operations")
     sub_hist = p_hist.add_subparsers(dest="sub_hist")
 
@@ -399,17 +466,24 @@ def build_parser() -> argparse.ArgumentParser:
     p_hist_swap.add_argument("--which", choices=["clipboard", "primary"], default="clipboard")
     p_hist_swap.set_defaults(func=cmd_history_swap)
 
-    # trigger
+
+def _add_trigger_parser(sub) -> None:
     p_tr = sub.add_parser("trigger", help="trigger an action (alias) or run a named action")
     p_tr.add_argument("cmd", nargs="?", help="trigger alias (e.g., prompt, command)")
-    p_tr.add_argument("--name", help="run specific named action instead of alias")
+    p_tr.add_argument("--name", action="append", help="run specific named action instead of alias (repeat to run several in one request)")
     src = p_tr.add_mutually_exclusive_group()
     src.add_argument("--from-clipboard", action="store_true", help="use current clipboard (default)")
     src.add_argument("--from-primary", action="store_true", help="use current primary selection")
     src.add_argument("--text", help="use literal text instead of reading a selection")
     p_tr.set_defaults(func=cmd_trigger)
 
-    # profile
+
+def _add_batch_parser(sub) -> None:
+    p_batch = sub.add_parser("batch", help="send JSON requests from stdin (one per line) over one connection")
+    p_batch.set_defaults(func=cmd_batch)
+
+
+def _add_profile_parser(sub) -> None:
     p_prof = sub.add_parser("profile", help="profile operations")
     sub_prof = p_prof.add_subparsers(dest="sub_prof")
 
@@ -434,20 +508,23 @@ def build_parser() -> argparse.ArgumentParser:
     p_prof_uninstall.add_argument("--shortcuts-only", action="store_true", help="remove shortcuts installed by the profile")
     p_prof_uninstall.set_defaults(func=cmd_profile_uninstall)
 
-    # shortcuts
+
+def _add_shortcuts_parser(sub) -> None:
     p_sc = sub.add_parser("shortcuts", help="shortcuts utilities")
     sub_sc = p_sc.add_subparsers(dest="sub_sc")
     p_sc_rm = sub_sc.add_parser("remove", help="remove shortcuts")
     p_sc_rm.add_argument("--recommended", action="store_true", help="remove recommended shortcuts")
     p_sc_rm.set_defaults(func=cmd_shortcuts_remove)
 
-    # autostart
+
+def _add_autostart_parser(sub) -> None:
     p_as = sub.add_parser("autostart", help="autostart utilities")
     sub_as = p_as.add_subparsers(dest="sub_as")
     p_as_disable = sub_as.add_parser("disable", help="disable autostart")
     p_as_disable.set_defaults(func=cmd_autostart_disable)
 
-    # config
+
+def _add_config_parser(sub) -> None:
     p_cfg = sub.add_parser("config", help="configuration utilities")
     sub_cfg = p_cfg.add_subparsers(dest="sub_cfg")
 
@@ -467,14 +544,66 @@ def build_parser() -> argparse.ArgumentParser:
 
     p_cfg_restore = sub_cfg.add_parser("restore", help="restore from a backup file")
     p_cfg_restore.add_argument("--file", required=True, help="path to backup file")
+    p_cfg_restore.add_argument("--move", action="store_true", help="move the backup into place instead of copying (same filesystem only)")
     p_cfg_restore.set_defaults(func=cmd_config_restore)
 
+_SUBCOMMANDS = {
+    "ui": _add_ui_parser,
+    "selection": _add_selection_parser,
+    "history": _add_history_parser,
+    "trigger": _add_trigger_parser,
+    "batch": _add_batch_parser,
+    "profile": _add_profile_parser,
+    "shortcuts": _add_shortcuts_parser,
+    "autostart": _add_autostart_parser,
+    "config": _add_config_parser,
+}
+
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser. With `only` set to a known top-level command, just that
+    subcommand tree is registered (used by _parse_args for valid invocations).
+    Parsers are built once per process and shared; do not modify the result.
+    """
+    return _build_parser(only if only in _SUBCOMMANDS else None)
+
+
+@lru_cache(maxsize=None)
+def _build_parser(only: str | None) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="wbridge", description="Selection/Shortcut Bridge CLI")
+    sub = p.add_subparsers(dest="sub")
+    if only in _SUBCOMMANDS:
+        _SUBCOMMANDS[only](sub)
+    else:
+        for add in _SUBCOMMANDS.values():
+            add(sub)
     return p
 
 
-def main(argv=None) -> int:
+def _parse_args(argv: list[str]) -> tuple[argparse.ArgumentParser, argparse.Namespace]:
+    """
+    Parse with only the invoked subcommand registered. Help, usage errors and
+    incomplete commands are re-parsed with the full parser, so everything printed
+    to the user (usage lines, choice lists) is exactly what the full CLI shows.
+    """
+    first = argv[0] if argv and not argv[0].startswith("-") else None
+    if first in _SUBCOMMANDS:
+        parser = build_parser(only=first)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                args = parser.parse_args(argv)
+        except SystemExit:
+            args = None
+        if args is not None and hasattr(args, "func"):
+            return parser, args
     parser = build_parser()
-    args = parser.parse_args(argv)
+    return parser, parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser, args = _parse_args(argv)
 
     if not hasattr(args, "func"):
         parser.print_help()
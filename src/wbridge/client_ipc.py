@@ -2,7 +2,8 @@
 IPC client utilities for wbridge.
 
 Transport:
-- Unix Domain Socket at $XDG_RUNTIME_DIR/wbridge.sock (see platform.socket_path)
+- Unix Domain Socket at $XDG_RUNTIME_DIR/wbridge.sock (see platform.socket_path);
+  on Linux the abstract-namespace name (platform.abstract_socket_name) is tried first
 - Newline-delimited JSON per request/response
 
 This module is used by the CLI to communicate with the running GUI app.
@@ -10,58 +11,121 @@ This module is used by the CLI to communicate with the running GUI app.
 
 from __future__ import annotations
 
-import json
 import os
 import socket
 from typing import Any, Dict, Tuple
 
-from .platform import socket_path
+from . import jsonutil
+from .platform import socket_path, abstract_socket_name, peer_is_same_user
 
 
-def send_request(obj: Dict[str, Any], timeout: float = 3.0) -> Tuple[bool, Dict[str, Any]]:
-    """
-    Send a single JSON request and wait for a single JSON response.
 
-    Returns:
-      (ok, response_dict)
-      ok = True if transport succeeded AND response contains {"ok": true}
-      ok = False otherwise (response will include error information if available)
+def _encode(obj: Dict[str, Any]) -> bytes:
+    return jsonutil.dumps(obj) + b"\n"
+
+
+def _decode(buf: bytes) -> Any:
+    return jsonutil.loads(buf)
+
+
+class IPCConnection:
+    """
+    An open connection to the app: the socket plus one buffered reader that is
+    reused for every response, so bytes read past a newline are never lost.
+    Usable as a context manager; closing it closes the reader and the socket.
     """
-    path = str(socket_path())
-    data = (json.dumps(obj) + "\n").encode("utf-8")
 
-    try:
-        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-            s.settimeout(timeout)
-            s.connect(path)
-            s.sendall(data)
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.reader = sock.makefile("rb", buffering=65536)
+
+    def close(self) -> None:
+        try:
+            self.reader.close()
+        finally:
+            self.sock.close()
+
+    def __enter__(self) -> "IPCConnection":
+        return self
 
-            # Read until newline
-            buf = b""
-            while not buf.endswith(b"\n"):
-                chunk = s.recv(65536)
-                if not chunk:
-                    break
-                buf += chunk
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
 
-        if not buf:
-            return False, {"ok": False, "error": "empty response from server"}
 
+def open_connection(timeout: float = 3.0) -> IPCConnection:
+    """
+    Connect to the running app's IPC socket. The returned connection can be used as a
+    context manager and reused for several send_on() exchanges.
+    """
+    abstract = abstract_socket_name()
+    if abstract is not None:
+        # Abstract namespace first (no path lookup); older servers only have the file.
+        # Any local user can bind an abstract name, so only accept a server running as us.
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            resp = json.loads(buf.decode("utf-8").rstrip("\n"))
-        except Exception as e:
-            return False, {"ok": False, "error": f"invalid json response: {e}"}
+            s.settimeout(timeout)
+            s.connect(abstract)
+            if peer_is_same_user(s):
+                return IPCConnection(s)
+            s.close()
+        except OSError:
+            s.close()
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        s.settimeout(timeout)
+        s.connect(str(socket_path()))
+    except Exception:
+        s.close()
+        raise
+    return IPCConnection(s)
 
-        if isinstance(resp, dict) and resp.get("ok") is True:
-            return True, resp
-        return False, resp if isinstance(resp, dict) else {"ok": False, "error": "malformed response"}
 
-    except FileNotFoundError:
-        return False, {"ok": False, "error": "server not running", "code": "NOT_RUNNING", "socket": path}
-    except socket.timeout:
+def send_on(conn: IPCConnection, obj: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Send one request on an open connection and wait for its response.
+    Transport errors (OSError, socket.timeout) propagate to the caller.
+    """
+    conn.sock.sendall(_encode(obj))
+
+    # One response line; the buffered reader does the recv loop in C
+    buf = conn.reader.readline()
+
+    if not buf:
+        return False, {"ok": False, "error": "empty response from server"}
+
+    try:
+        resp = _decode(buf)
+    except Exception as e:
+        return False, {"ok": False, "error": f"invalid json response: {e}"}
+
+    if isinstance(resp, dict) and resp.get("ok") is True:
+        return True, resp
+    return False, resp if isinstance(resp, dict) else {"ok": False, "error": "malformed response"}
+
+
+def transport_error(e: BaseException) -> Tuple[bool, Dict[str, Any]]:
+    """Map a connect/send/recv exception to the (ok, response) shape of send_request."""
+    if isinstance(e, FileNotFoundError):
+        return False, {"ok": False, "error": "server not running", "code": "NOT_RUNNING", "socket": str(socket_path())}
+    if isinstance(e, socket.timeout):
         return False, {"ok": False, "error": "timeout", "code": "TIMEOUT"}
+    return False, {"ok": False, "error": str(e)}
+
+
+def send_request(obj: Dict[str, Any], timeout: float = 3.0) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Send a single JSON request and wait for a single JSON response.
+
+    Returns:
+      (ok, response_dict)
+      ok = True if transport succeeded AND response contains {"ok": true}
+      ok = False otherwise (response will include error information if available)
+    """
+    try:
+        with open_connection(timeout) as conn:
+            return send_on(conn, obj)
     except Exception as e:
-        return False, {"ok": False, "error": str(e)}
+        return transport_error(e)
 
 
 def cli_exit_code_from_response(ok: bool, resp: Dict[str, Any]) -> int:
@@ -13,31 +13,56 @@ Provides:
 from __future__ import annotations
 
 import configparser
-import json
 import os
+import pickle
+import re
 import tempfile
-from dataclasses import dataclass
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
 
+from . import jsonutil
 from .platform import xdg_config_dir, ensure_dirs
+from .actions import PLACEHOLDER_RE, ActionSpec, clear_expand_cache, parse_action
 
 
-DEFAULT_SETTINGS = {
-    "general": {
+# Read-only: the defaults parser is built from this once (see _parser_with_defaults)
+DEFAULT_SETTINGS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "general": MappingProxyType({
         "history_max": "50",
         "poll_interval_ms": "300",
-    },
-    "gnome": {
+    }),
+    "gnome": MappingProxyType({
         "manage_shortcuts": "true",
-    },
-}
+    }),
+})
+
+
+# Pickled defaults-only parser; unpickling a copy is cheaper than rebuilding it
+_defaults_template: Optional[bytes] = None
+
+
+def _parser_with_defaults() -> configparser.RawConfigParser:
+    global _defaults_template
+    if _defaults_template is not None:
+        return pickle.loads(_defaults_template)
+    parser = configparser.RawConfigParser()
+    parser.read_dict(DEFAULT_SETTINGS)
+    _defaults_template = pickle.dumps(parser)
+    return parser
 
 
 @dataclass
 class Settings:
-    config: configparser.ConfigParser
+    config: configparser.RawConfigParser
     path: Path
+    # as_mapping() result, built on first use. Settings objects are not mutated after
+    # loading; a changed settings.ini yields a new object via load_settings()' file-signature
+    # cache (see invalidate_settings_cache())
+    _mapping: Optional[Dict[str, Dict[str, str]]] = field(default=None, init=False, repr=False, compare=False)
 
     def get(self, section: str, key: str, fallback: Optional[str] = None) -> str:
         return self.config.get(section, key, fallback=fallback)  # type: ignore[no-any-return]
@@ -59,49 +84,102 @@ class Settings:
             return fallback
 
     def as_mapping(self) -> Dict[str, Dict[str, str]]:
-        # Return nested dict for placeholder expansion
-        mapping: Dict[str, Dict[str, str]] = {}
-        for section in self.config.sections():
-            mapping[section] = {}
-            for key, val in self.config.items(section):
-                mapping[section][key] = val
-        return mapping
+        # Return nested dict for placeholder expansion; built once and shared (read-only)
+        if self._mapping is None:
+            mapping: Dict[str, Dict[str, str]] = {}
+            for section in self.config.sections():
+                mapping[section] = dict(self.config.items(section))
+            self._mapping = mapping
+        return self._mapping
 
 
 @dataclass
 class ActionsConfig:
     actions: List[Dict[str, Any]]
     triggers: Dict[str, str]
+    # name -> action dict (first definition wins), built once at load
+    by_name: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # name -> typed spec, parsed once at load (see actions.parse_action)
+    specs: Dict[str, ActionSpec] = field(default_factory=dict)
+
+
+# Last parsed settings.ini / actions.json, keyed by the file signature (_file_sig).
+# Callers share the cached objects and must treat them as read-only.
+_settings_cache: Optional[tuple[tuple, Settings]] = None
+_actions_cache: Optional[tuple[tuple, ActionsConfig]] = None
+# Pickled parser behind _load_settings_parser_with_defaults() (each caller unpickles its own copy)
+_settings_parser_cache: Optional[tuple[tuple, bytes]] = None
+
+
+def _file_sig(path: Path) -> tuple:
+    # os.replace() in the atomic writers yields a new inode, so same-tick rewrites are caught too
+    try:
+        st = os.stat(path)
+        return (str(path), st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        return (str(path), None)
+
+
+def invalidate_settings_cache() -> None:
+    global _settings_cache, _settings_parser_cache
+    _settings_cache = None
+    _settings_parser_cache = None
+
+
+def invalidate_actions_cache() -> None:
+    global _actions_cache
+    _actions_cache = None
 
 
 def load_settings() -> Settings:
+    """
+    Load settings.ini (with DEFAULT_SETTINGS preloaded). The parsed result is
+    cached and reused until the file changes on disk.
+    """
+    global _settings_cache
     ensure_dirs()
     cfg_dir = xdg_config_dir()
     ini_path = cfg_dir / "settings.ini"
+    sig = _file_sig(ini_path)
+    cached = _settings_cache
+    if cached is not None and cached[0] == sig:
+        return cached[1]
 
-    parser = configparser.ConfigParser()
     # preload defaults
-    for section, kv in DEFAULT_SETTINGS.items():
-        parser.add_section(section)
-        for k, v in kv.items():
-            parser.set(section, k, v)
+    parser = _parser_with_defaults()
 
     if ini_path.exists():
         parser.read(ini_path)
 
-    return Settings(parser, ini_path)
+    settings = Settings(parser, ini_path)
+    _settings_cache = (sig, settings)
+    return settings
 
 
 def load_actions() -> ActionsConfig:
+    """
+    Load actions.json into an ActionsConfig. The result is cached and reused
+    until the file changes on disk.
+    """
+    global _actions_cache
     cfg_dir = xdg_config_dir()
     actions_path = cfg_dir / "actions.json"
+    sig = _file_sig(actions_path)
+    cached = _actions_cache
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    cfg = _load_actions_uncached(actions_path)
+    _actions_cache = (sig, cfg)
+    return cfg
 
+
+def _load_actions_uncached(actions_path: Path) -> ActionsConfig:
     if not actions_path.exists():
         # Default empty config if not present
         return ActionsConfig(actions=[], triggers={})
 
     try:
-        data = json.loads(actions_path.read_text(encoding="utf-8"))
+        data = _read_json(actions_path)
     except Exception:
         return ActionsConfig(actions=[], triggers={})
 
@@ -111,7 +189,21 @@ def load_actions() -> ActionsConfig:
         actions = []
     if not isinstance(triggers, dict):
         triggers = {}
-    return ActionsConfig(actions=actions, triggers=triggers)
+    # previously loaded action objects are being replaced
+    clear_expand_cache()
+    by_name: Dict[str, Dict[str, Any]] = {}
+    specs: Dict[str, ActionSpec] = {}
+    for a in actions:
+        if not isinstance(a, dict):
+            continue
+        name = a.get("name")
+        if not name or name in by_name:
+            continue
+        by_name[name] = a
+        spec = parse_action(a)
+        if spec is not None:
+            specs[name] = spec
+    return ActionsConfig(actions=actions, triggers=triggers, by_name=by_name, specs=specs)
 
 
 # --------- Actions read/write helpers ---------
@@ -126,7 +218,7 @@ def load_actions_raw() -> Dict[str, Any]:
     actions_path = cfg_dir / "actions.json"
     try:
         if actions_path.exists():
-            data = json.loads(actions_path.read_text(encoding="utf-8"))
+            data = _read_json(actions_path)
             if isinstance(data, dict):
                 data.setdefault("actions", [])
                 data.setdefault("triggers", {})
@@ -140,39 +232,83 @@ def load_actions_raw() -> Dict[str, Any]:
     return {"actions": [], "triggers": {}}
 
 
-def _write_json_atomic(data: Dict[str, Any], path: Path) -> None:
+def _read_json(path: Path) -> Any:
+    # Parse straight from bytes (no separate decode pass)
+    return jsonutil.loads(path.read_bytes())
+
+
+def _dump_json(data: Any) -> bytes:
+    # Same layout either way: 2-space indent, non-ASCII kept as UTF-8
+    return jsonutil.dumps(data, indent=True)
+
+
+def _fsync_dir(path: Path) -> None:
+    # Persist the rename itself (directory entry); best-effort
+    try:
+        dfd = os.open(str(path), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(dfd)
+    except OSError:
+        pass
+    finally:
+        os.close(dfd)
+
+
+def _write_json_atomic(data: Dict[str, Any], path: Path, payload: Optional[bytes] = None,
+                       durable: bool = True) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(data, ensure_ascii=False, indent=2)
-    with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False, dir=path.parent, prefix=path.name + ".") as tf:
+    if payload is None:
+        payload = _dump_json(data)
+    with tempfile.NamedTemporaryFile("wb", delete=False, dir=path.parent, prefix=path.name + ".") as tf:
         tf.write(payload)
-        tf.flush()
-        os.fsync(tf.fileno())
+        if durable:
+            tf.flush()
+            os.fsync(tf.fileno())
         tmpname = tf.name
     os.replace(tmpname, path)
+    if durable:
+        _fsync_dir(path.parent)
+    invalidate_actions_cache()
+
+
+class _Unchanged:
+    def __repr__(self) -> str:
+        return "ACTIONS_UNCHANGED"
+
 
+# Returned by write_actions_config() when actions.json already held the content
+ACTIONS_UNCHANGED = _Unchanged()
 
-def write_actions_config(data: Dict[str, Any]) -> Optional[Path]:
+
+def write_actions_config(data: Dict[str, Any]) -> Union[Optional[Path], _Unchanged]:
     """
     Atomically write actions.json. Creates a timestamped backup if the file exists.
     Returns backup path or None if no previous file existed.
+    If the file already holds exactly this content, nothing is written and
+    ACTIONS_UNCHANGED is returned.
     """
     ensure_dirs()
     cfg_dir = xdg_config_dir()
     actions_path = cfg_dir / "actions.json"
+    payload = _dump_json(data)
+    try:
+        if actions_path.read_bytes() == payload:
+            return ACTIONS_UNCHANGED
+    except OSError:
+        pass
     backup: Optional[Path] = None
     if actions_path.exists():
-        backup = actions_path.with_suffix(actions_path.suffix + ".bak-" + Path(tempfile.mkstemp()[1]).name.split(".")[-1])
         try:
-            # Better timestamped backup name
-            from datetime import datetime
-            ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+            ts = time.strftime("%Y%m%d-%H%M%S")
             backup = actions_path.with_suffix(actions_path.suffix + f".bak-{ts}")
             actions_path.replace(backup)
         except Exception:
             backup = None
     # If we moved file to backup, we need to write fresh new file; otherwise overwrite atomically
     try:
-        _write_json_atomic(data, actions_path)
+        _write_json_atomic(data, actions_path, payload)
     except Exception:
         # best-effort: if write failed and we created a backup, try to restore
         try:
@@ -242,50 +378,62 @@ def expand_placeholders(text: str, selection_text: str, extra: Optional[Dict[str
     """
     Very simple placeholder expansion for:
       - {text}
-      - {config.section.key}
-    Additional placeholders can be added later (app info, history, timestamps, etc.).
+      - {config.section.key}  (section may contain dots, e.g. {config.endpoint.local.base_url})
+      - {<key>} for keys in `extra`
+    Single pass over the template: substituted values are not expanded again and
+    unknown placeholders are left untouched.
     """
-    if text is None:
+    if text is None or "{" not in text:
         return text
-    out = text.replace("{text}", selection_text or "")
-    if settings_map:
-        # allow {config.section.key}
-        # naive approach to avoid heavy templating
-        for section, kv in settings_map.items():
-            for k, v in kv.items():
-                out = out.replace(f"{{config.{section}.{k}}}", v)
-    if extra:
-        for k, v in extra.items():
-            out = out.replace(f"{{{k}}}", str(v))
-    return out
+
+    def _sub(m: "re.Match[str]") -> str:
+        name = m.group(1)
+        if name == "text":
+            return selection_text or ""
+        if settings_map and name.startswith("config."):
+            section, _, key = name[7:].rpartition(".")
+            kv = settings_map.get(section)
+            if kv is not None and key in kv:
+                return kv[key]
+        if extra and name in extra:
+            return str(extra[name])
+        return m.group(0)
+
+    return PLACEHOLDER_RE.sub(_sub, text)
 
 
 # --------- Settings write helpers (atomic) ---------
 
-def _write_ini_atomic(parser: configparser.ConfigParser, path: Path) -> None:
+def _write_ini_atomic(parser: configparser.RawConfigParser, path: Path, durable: bool = True) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False, dir=path.parent, prefix=path.name + ".") as tf:
         parser.write(tf)
-        tf.flush()
-        os.fsync(tf.fileno())
+        if durable:
+            tf.flush()
+            os.fsync(tf.fileno())
         tmpname = tf.name
     os.replace(tmpname, path)
+    if durable:
+        _fsync_dir(path.parent)
+    invalidate_settings_cache()
 
 
-def _load_settings_parser_with_defaults() -> tuple[configparser.ConfigParser, Path]:
+def _load_settings_parser_with_defaults() -> tuple[configparser.RawConfigParser, Path]:
     """
     Internal helper: load settings.ini with DEFAULT_SETTINGS preloaded.
+    Callers get their own copy to modify; the file is only re-read when it changed.
     """
+    global _settings_parser_cache
     ensure_dirs()
     cfg_dir = xdg_config_dir()
     ini_path = cfg_dir / "settings.ini"
+    sig = _file_sig(ini_path)
+    cached = _settings_parser_cache
+    if cached is not None and cached[0] == sig:
+        return pickle.loads(cached[1]), ini_path
 
-    parser = configparser.ConfigParser()
     # preload defaults to ensure required sections exist
-    for section, kv in DEFAULT_SETTINGS.items():
-        parser.add_section(section)
-        for k, v in kv.items():
-            parser.set(section, k, v)
+    parser = _parser_with_defaults()
 
     if ini_path.exists():
         try:
@@ -294,9 +442,22 @@ def _load_settings_parser_with_defaults() -> tuple[configparser.ConfigParser, Pa
             # continue with defaults
             pass
 
+    _settings_parser_cache = (sig, pickle.dumps(parser))
     return parser, ini_path
 
 
+@contextmanager
+def batched_settings_write(durable: bool = True) -> Iterator[configparser.RawConfigParser]:
+    """
+    Load settings.ini once, let several set_*/upsert/delete helpers modify the
+    yielded parser (pass it as `parser=`), and write it back once on exit.
+    Nothing is written if the block raises.
+    """
+    parser, ini_path = _load_settings_parser_with_defaults()
+    yield parser
+    _write_ini_atomic(parser, ini_path, durable=durable)
+
+
 # --------- V2 INI helpers: endpoints and shortcuts ---------
 
 def list_endpoints(settings: Settings) -> Dict[str, Dict[str, str]]:
@@ -323,11 +484,16 @@ def list_endpoints(settings: Settings) -> Dict[str, Dict[str, str]]:
     return result
 
 
-def upsert_endpoint(id: str, base_url: str, health_path: str = "/health", trigger_path: str = "/trigger") -> None:
+_SLUG_RE = re.compile(r"[a-z0-9_-]+")
+
+
+def upsert_endpoint(id: str, base_url: str, health_path: str = "/health", trigger_path: str = "/trigger",
+                    parser: Optional[configparser.RawConfigParser] = None) -> None:
     """
     Create or update [endpoint.<id>] with provided values. Minimal validation applied.
+    With `parser` (see batched_settings_write) only that parser is modified.
     """
-    if not id or any(c for c in id if c not in "abcdefghijklmnopqrstuvwxyz0123456789_-"):
+    if not id or not _SLUG_RE.fullmatch(id):
         raise ValueError("endpoint id must be a slug [a-z0-9_-]+")
     if not base_url.startswith(("http://", "https://")):
         raise ValueError("base_url must start with http:// or https://")
@@ -336,25 +502,31 @@ def upsert_endpoint(id: str, base_url: str, health_path: str = "/health", trigge
     if not trigger_path.startswith("/"):
         raise ValueError("trigger_path must start with '/'")
 
-    parser, ini_path = _load_settings_parser_with_defaults()
+    own = parser is None
+    if own:
+        parser, ini_path = _load_settings_parser_with_defaults()
     section = f"endpoint.{id}"
     if not parser.has_section(section):
         parser.add_section(section)
     parser.set(section, "base_url", base_url)
     parser.set(section, "health_path", health_path or "/health")
     parser.set(section, "trigger_path", trigger_path or "/trigger")
-    _write_ini_atomic(parser, ini_path)
+    if own:
+        _write_ini_atomic(parser, ini_path)
 
 
-def delete_endpoint(id: str) -> bool:
+def delete_endpoint(id: str, parser: Optional[configparser.RawConfigParser] = None) -> bool:
     """
     Delete [endpoint.<id>] section if present. Returns True if removed.
     """
-    parser, ini_path = _load_settings_parser_with_defaults()
+    own = parser is None
+    if own:
+        parser, ini_path = _load_settings_parser_with_defaults()
     section = f"endpoint.{id}"
     if parser.has_section(section):
         parser.remove_section(section)
-        _write_ini_atomic(parser, ini_path)
+        if own:
+            _write_ini_atomic(parser, ini_path)
         return True
     return False
 
@@ -371,29 +543,35 @@ def get_shortcuts_map(settings: Settings) -> Dict[str, str]:
     return mapping
 
 
-def set_shortcuts_map(mapping: Dict[str, str]) -> None:
+def set_shortcuts_map(mapping: Dict[str, str], parser: Optional[configparser.RawConfigParser] = None) -> None:
     """
     Overwrite [gnome.shortcuts] with the provided alias -> binding pairs.
     """
-    parser, ini_path = _load_settings_parser_with_defaults()
+    own = parser is None
+    if own:
+        parser, ini_path = _load_settings_parser_with_defaults()
     section = "gnome.shortcuts"
     if parser.has_section(section):
         parser.remove_section(section)
     parser.add_section(section)
     for alias, binding in mapping.items():
         parser.set(section, str(alias), str(binding))
-    _write_ini_atomic(parser, ini_path)
+    if own:
+        _write_ini_atomic(parser, ini_path)
 
 
-def set_manage_shortcuts(on: bool) -> None:
+def set_manage_shortcuts(on: bool, parser: Optional[configparser.RawConfigParser] = None) -> None:
     """
     Set [gnome].manage_shortcuts = true/false.
     """
-    parser, ini_path = _load_settings_parser_with_defaults()
+    own = parser is None
+    if own:
+        parser, ini_path = _load_settings_parser_with_defaults()
     if not parser.has_section("gnome"):
         parser.add_section("gnome")
     parser.set("gnome", "manage_shortcuts", "true" if on else "false")
-    _write_ini_atomic(parser, ini_path)
+    if own:
+        _write_ini_atomic(parser, ini_path)
 
 
 # --------- V2 INI helpers: secrets ---------
@@ -413,15 +591,18 @@ def get_secrets_map(settings: Settings) -> Dict[str, str]:
     return mapping
 
 
-def set_secrets_map(mapping: Dict[str, str]) -> None:
+def set_secrets_map(mapping: Dict[str, str], parser: Optional[configparser.RawConfigParser] = None) -> None:
     """
     Overwrite [secrets] with the provided key -> value pairs.
     """
-    parser, ini_path = _load_settings_parser_with_defaults()
+    own = parser is None
+    if own:
+        parser, ini_path = _load_settings_parser_with_defaults()
     section = "secrets"
     if parser.has_section(section):
         parser.remove_section(section)
     parser.add_section(section)
     for k, v in (mapping or {}).items():
         parser.set(section, str(k), str(v))
-    _write_ini_atomic(parser, ini_path)
+    if own:
+        _write_ini_atomic(parser, ini_path)
@@ -13,14 +13,19 @@ Schema keys:
 
 from __future__ import annotations
 
-from typing import Dict, List
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
 try:
     import gi
     gi.require_version("Gio", "2.0")
-    from gi.repository import Gio  # type: ignore
+    from gi.repository import Gio, GLib  # type: ignore
 except Exception:
     Gio = None  # type: ignore
+    GLib = None  # type: ignore
 
 
 BASE_SCHEMA = "org.gnome.settings-daemon.plugins.media-keys"
@@ -29,6 +34,10 @@ BASE_KEY = "custom-keybindings"
 
 # Path template: must end with a slash
 PATH_PREFIX = "/org/gnome/settings-daemon/plugins/media-keys/custom-keybindings/"
+WBRIDGE_PATH_PREFIX = PATH_PREFIX + "wbridge-"
+_PATH_PREFIX_LEN = len(PATH_PREFIX)
+# String keys of a custom-keybinding entry
+_ENTRY_KEYS = ("name", "command", "binding")
 PATH_SUFFIXES = {
     "prompt": "wbridge-prompt/",
     "command": "wbridge-command/",
@@ -41,13 +50,36 @@ def _ensure_gio() -> None:
         raise RuntimeError("Gio not available (PyGObject missing)")
 
 
+# Gio.Settings objects are reused across calls (schema lookup/backend setup once).
+# The cache is per thread, so the background worker (sync_from_ini_async) and the
+# direct callers on the GTK main thread never share one Gio.Settings object.
+_local = threading.local()
+
+# Single worker for the *_async entry points; jobs run one after another
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wbridge-shortcuts")
+    return _EXECUTOR
+
+
 def _get_base_settings():
-    return Gio.Settings.new(BASE_SCHEMA)  # type: ignore
+    base = getattr(_local, "base", None)
+    if base is None:
+        base = _local.base = Gio.Settings.new(BASE_SCHEMA)  # type: ignore
+    return base
 
 
 def _get_paths(base) -> List[str]:
+    # PyGObject already returns a fresh Python list for the strv; no extra copy needed
     try:
-        return list(base.get_strv(BASE_KEY))
+        return base.get_strv(BASE_KEY)
     except Exception:
         return []
 
@@ -57,7 +89,29 @@ def _set_paths(base, paths: List[str]) -> None:
 
 
 def _custom_settings_for(path: str):
-    return Gio.Settings.new_with_path(CUSTOM_SCHEMA, path)  # type: ignore
+    cache: Dict[str, object] = _local.__dict__.setdefault("custom", {})
+    custom = cache.get(path)
+    if custom is None:
+        custom = cache[path] = Gio.Settings.new_with_path(CUSTOM_SCHEMA, path)  # type: ignore
+    return custom
+
+
+def _write_binding(full_path: str, name: str, command: str, binding: str) -> None:
+    # delay()/apply(): the three keys go to dconf as one change set
+    custom = _custom_settings_for(full_path)
+    custom.delay()
+    ok = False
+    try:
+        custom.set_string("name", name)
+        custom.set_string("command", command)
+        custom.set_string("binding", binding)
+        ok = True
+    finally:
+        # Never leave the cached object in delay mode with pending changes
+        if ok:
+            custom.apply()
+        else:
+            custom.revert()
 
 
 def install_binding(path_suffix: str, name: str, command: str, binding: str) -> None:
@@ -66,17 +120,15 @@ def install_binding(path_suffix: str, name: str, command: str, binding: str) ->
     """
     _ensure_gio()
     base = _get_base_settings()
-    paths = _get_paths(base)
+    # dict keys: ordered set (also drops manual duplicates when we write back)
+    paths = dict.fromkeys(_get_paths(base))
 
-    full_path = f"{PATH_PREFIX}{path_suffix}"
+    full_path = PATH_PREFIX + path_suffix
     if full_path not in paths:
-        paths.append(full_path)
-        _set_paths(base, paths)
+        paths[full_path] = None
+        _set_paths(base, list(paths))
 
-    custom = _custom_settings_for(full_path)
-    custom.set_string("name", name)
-    custom.set_string("command", command)
-    custom.set_string("binding", binding)
+    _write_binding(full_path, name, command, binding)
 
 
 def remove_binding(path_suffix: str) -> None:
@@ -85,12 +137,12 @@ def remove_binding(path_suffix: str) -> None:
     """
     _ensure_gio()
     base = _get_base_settings()
-    paths = _get_paths(base)
+    paths = dict.fromkeys(_get_paths(base))
 
-    full_path = f"{PATH_PREFIX}{path_suffix}"
+    full_path = PATH_PREFIX + path_suffix
     if full_path in paths:
-        paths.remove(full_path)
-        _set_paths(base, paths)
+        del paths[full_path]
+        _set_paths(base, list(paths))
     # Best-effort: GNOME cleans up orphan entries; explicit deletion isn't required by Gio.Settings API.
 
 
@@ -109,11 +161,25 @@ def install_recommended_shortcuts(bindings: Dict[str, str]) -> None:
         "command": ("Bridge: Command", "wbridge trigger command --from-clipboard"),
         "ui_show": ("Bridge: Show UI", "wbridge ui show"),
     }
+    entries = []
     for key, binding in bindings.items():
         if key not in PATH_SUFFIXES or key not in mapping:
             continue
         name, cmd = mapping[key]
-        install_binding(PATH_SUFFIXES[key], name, cmd, binding)
+        entries.append((PATH_PREFIX + PATH_SUFFIXES[key], name, cmd, binding))
+    if not entries:
+        return
+
+    # Register all paths with a single custom-keybindings update
+    base = _get_base_settings()
+    paths = dict.fromkeys(_get_paths(base))
+    before = len(paths)
+    paths.update(dict.fromkeys(e[0] for e in entries))
+    if len(paths) != before:
+        _set_paths(base, list(paths))
+
+    for full_path, name, cmd, binding in entries:
+        _write_binding(full_path, name, cmd, binding)
 
 
 def remove_recommended_shortcuts() -> None:
@@ -124,12 +190,12 @@ def remove_recommended_shortcuts() -> None:
 
 # ---------------- V2 generic helpers (INI as SoT) ----------------
 
+_SLUG_RE = re.compile(r"[^a-z0-9-]+")
+
+
+@lru_cache(maxsize=512)
 def _slug(s: str) -> str:
-    try:
-        import re
-        return re.sub(r"[^a-z0-9\\-]+", "-", s.lower()).strip("-")
-    except Exception:
-        return s
+    return _SLUG_RE.sub("-", s.lower()).strip("-")
 
 
 def install_from_mapping(bindings: Dict[str, str]) -> Dict[str, int]:
@@ -143,6 +209,7 @@ def install_from_mapping(bindings: Dict[str, str]) -> Dict[str, int]:
     """
     _ensure_gio()
     installed = skipped = 0
+    entries = []
     for alias, binding in (bindings or {}).items():
         try:
             alias = str(alias or "").strip()
@@ -156,8 +223,23 @@ def install_from_mapping(bindings: Dict[str, str]) -> Dict[str, int]:
             else:
                 name = f"Bridge: {alias}"
                 cmd = f"wbridge trigger {alias}"
-            suffix = f"wbridge-{_slug(alias)}/"
-            install_binding(suffix, name, cmd, binding)
+            entries.append((PATH_PREFIX + _suffix_for_alias(alias), name, cmd, binding))
+        except Exception:
+            skipped += 1
+    if not entries:
+        return {"installed": installed, "skipped": skipped}
+
+    # Register all paths with a single custom-keybindings update
+    base = _get_base_settings()
+    paths = dict.fromkeys(_get_paths(base))
+    before = len(paths)
+    paths.update(dict.fromkeys(e[0] for e in entries))
+    if len(paths) != before:
+        _set_paths(base, list(paths))
+
+    for full_path, name, cmd, binding in entries:
+        try:
+            _write_binding(full_path, name, cmd, binding)
             installed += 1
         except Exception:
             skipped += 1
@@ -172,26 +254,17 @@ def remove_all_wbridge_shortcuts() -> Dict[str, int]:
     _ensure_gio()
     base = _get_base_settings()
     paths = _get_paths(base)
-    kept: List[str] = []
-    removed = 0
-    for p in paths:
-        try:
-            if not isinstance(p, str):
-                kept.append(p)
-                continue
-            # Example path: /org/.../custom-keybindings/wbridge-foo/
-            if p.startswith(PATH_PREFIX + "wbridge-"):
-                removed += 1
-                continue
-            kept.append(p)
-        except Exception:
-            kept.append(p)
-    _set_paths(base, kept)
+    # Example path: /org/.../custom-keybindings/wbridge-foo/
+    kept = [p for p in paths if not (isinstance(p, str) and p.startswith(WBRIDGE_PATH_PREFIX))]
+    removed = len(paths) - len(kept)
+    if removed:
+        _set_paths(base, kept)
     return {"removed": removed, "kept": len(kept)}
 
 
 # ---------------- V2 sync helpers ----------------
 
+@lru_cache(maxsize=512)
 def _suffix_for_alias(alias: str) -> str:
     """
     Deterministic custom-keybinding path suffix for an alias.
@@ -214,7 +287,7 @@ def list_installed() -> List[Dict[str, str]]:
                 continue
             if not p.startswith(PATH_PREFIX):
                 continue
-            suffix = p[len(PATH_PREFIX):]
+            suffix = p[_PATH_PREFIX_LEN:]
             if not suffix.startswith("wbridge-"):
                 continue
             custom = _custom_settings_for(p)
@@ -237,25 +310,25 @@ def sync_from_ini(settings_map: Dict[str, Dict[str, str]], auto_remove: bool = T
     """
     _ensure_gio()
 
-    # Extract desired mapping alias -> binding from settings_map["gnome.shortcuts"]
-    desired_section = {}
+    # Normalise [gnome.shortcuts] into (alias, binding) pairs in a single pass
+    desired: List[Tuple[str, str]] = []
     try:
         if isinstance(settings_map, dict):
-            desired_section = dict(settings_map.get("gnome.shortcuts", {}) or {})
+            pairs = ((str(k or "").strip(), str(v or "").strip())
+                     for k, v in (settings_map.get("gnome.shortcuts") or {}).items())
+            desired = [(alias, binding) for alias, binding in pairs if alias and binding]
     except Exception:
-        desired_section = {}
-
-    desired: Dict[str, str] = {}
-    for k, v in desired_section.items():
-        alias = str(k or "").strip()
-        binding = str(v or "").strip()
-        if alias and binding:
-            desired[alias] = binding
+        desired = []
 
     installed = updated = removed = skipped = 0
 
+    # custom-keybindings is read once and written back (at most) once at the end
+    base = _get_base_settings()
+    original = _get_paths(base)
+    paths = dict.fromkeys(original)
+
     # Install or update desired entries
-    for alias, binding in desired.items():
+    for alias, binding in desired:
         try:
             suffix = _suffix_for_alias(alias)
             full_path = PATH_PREFIX + suffix
@@ -267,57 +340,99 @@ def sync_from_ini(settings_map: Dict[str, Dict[str, str]], auto_remove: bool = T
                 name = f"Bridge: {alias}"
                 cmd = f"wbridge trigger {alias}"
 
-            base = _get_base_settings()
-            paths = _get_paths(base)
             if full_path in paths:
                 # Update binding/name/command if needed
+                custom = _custom_settings_for(full_path)
+                # Read the entry once, compare in memory and write only the keys that differ
                 try:
-                    custom = _custom_settings_for(full_path)
-                    changed = False
-                    if custom.get_string("binding") != binding:
-                        custom.set_string("binding", binding)
-                        changed = True
-                    try:
-                        if custom.get_string("name") != name:
-                            custom.set_string("name", name)
-                            changed = True
-                        if custom.get_string("command") != cmd:
-                            custom.set_string("command", cmd)
-                            changed = True
-                    except Exception:
-                        pass
-                    if changed:
-                        updated += 1
-                    else:
-                        skipped += 1
+                    current = [custom.get_string(k) for k in _ENTRY_KEYS]
                 except Exception:
-                    # Fallback: install
-                    install_binding(suffix, name, cmd, binding)
-                    installed += 1
+                    current = None
+                if current is None:
+                    # Unreadable entry: rewrite it completely
+                    _write_binding(full_path, name, cmd, binding)
+                    updated += 1
+                    continue
+                delta = [
+                    (k, want)
+                    for k, want, have in zip(_ENTRY_KEYS, (name, cmd, binding), current)
+                    if have != want
+                ]
+                if not delta:
+                    skipped += 1
+                    continue
+                # Same pattern as _write_binding: apply only a complete change set
+                custom.delay()
+                ok = False
+                try:
+                    for k, want in delta:
+                        custom.set_string(k, want)
+                    ok = True
+                finally:
+                    if ok:
+                        custom.apply()
+                    else:
+                        custom.revert()
+                updated += 1
             else:
-                # Fresh install
-                install_binding(suffix, name, cmd, binding)
+                # Fresh install; the path is registered with the final set_strv
+                _write_binding(full_path, name, cmd, binding)
+                paths[full_path] = None
                 installed += 1
         except Exception:
             skipped += 1
 
     # Optionally remove entries that are no longer desired
     if auto_remove:
-        desired_suffixes = {_suffix_for_alias(a) for a in desired.keys()}
-        base2 = _get_base_settings()
-        paths2 = _get_paths(base2)
-        for p in paths2:
+        desired_suffixes = {_suffix_for_alias(a) for a, _b in desired}
+        for p in list(paths):
             try:
                 if not isinstance(p, str):
                     continue
-                if not p.startswith(PATH_PREFIX + "wbridge-"):
+                if not p.startswith(WBRIDGE_PATH_PREFIX):
                     continue
-                suf = p[len(PATH_PREFIX):]
+                suf = p[_PATH_PREFIX_LEN:]
                 if suf not in desired_suffixes:
-                    remove_binding(suf)
+                    del paths[p]
                     removed += 1
             except Exception:
                 # ignore removal errors
                 pass
 
+    if list(paths) != original:
+        _set_paths(base, list(paths))
+
     return {"installed": installed, "updated": updated, "removed": removed, "skipped": skipped}
+
+
+# --------- Background sync (GUI) ---------
+
+def sync_from_ini_async(
+    settings_map: Dict[str, Dict[str, str]],
+    callback: Callable[[Optional[Dict[str, int]], Optional[BaseException]], None],
+    auto_remove: bool = True,
+) -> "Future[Dict[str, int]]":
+    """
+    Run sync_from_ini off the GTK main thread so the dconf writes never block the UI.
+    callback(result, error) is invoked on the main loop via GLib.idle_add; exactly one
+    of result/error is set. The synchronous sync_from_ini remains the CLI entry point.
+    """
+    _ensure_gio()
+
+    def _deliver(result: Optional[Dict[str, int]], error: Optional[BaseException]) -> bool:
+        try:
+            callback(result, error)
+        except Exception:
+            pass
+        return False
+
+    def _on_done(fut: "Future[Dict[str, int]]") -> None:
+        try:
+            result, error = fut.result(), None
+        except Exception as e:
+            result, error = None, e
+        GLib.idle_add(_deliver, result, error)  # type: ignore
+
+    fut = _get_executor().submit(sync_from_ini, settings_map, auto_remove)
+    fut.add_done_callback(_on_done)
+    return fut
@@ -0,0 +1,48 @@
+"""
+JSON (de)serialization helpers shared by config, CLI, IPC client and actions.
+
+orjson is used when installed (faster). Every helper falls back to the stdlib
+json module when orjson is missing or rejects the data (e.g. integers wider than
+64 bits, non-str dict keys), so valid input never fails because of the backend.
+Output is UTF-8 (non-ASCII kept), compact or with a 2-space indent.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson  # optional
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# orjson.loads silently turns integers beyond 64 bits into floats; inputs with a run of
+# 20+ digits (possible wide ints) are left to the stdlib, which keeps them exact.
+_WIDE_INT_RE = re.compile(rb"\d{20,}")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes; compact unless indent=True (2 spaces)."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # e.g. int wider than 64 bits; stdlib handles it
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON from bytes or str. Raises ValueError (json.JSONDecodeError) on invalid input."""
+    if orjson is not None:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        if _WIDE_INT_RE.search(raw) is None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # let stdlib decide (and produce its usual error message)
+    return json.loads(data)
@@ -8,6 +8,10 @@ Platform utilities for wbridge.
 from __future__ import annotations
 
 import os
+import socket
+import struct
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -44,6 +48,27 @@ def socket_path() -> Path:
     return runtime_dir() / SOCKET_FILENAME
 
 
+def abstract_socket_name() -> Optional[bytes]:
+    """
+    Linux abstract-namespace address of the IPC socket (no filesystem entry),
+    or None on other platforms. Abstract sockets have no file permissions and any
+    local user can claim the name, so both ends check peer_is_same_user().
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    return b"\0" + f"{APP_NAME}-{os.getuid()}".encode()
+
+
+def peer_is_same_user(sock: socket.socket) -> bool:
+    """True if the process on the other end of a connected Unix socket runs as our uid."""
+    try:
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _pid, uid, _gid = struct.unpack("3i", creds)
+        return uid == os.getuid()
+    except Exception:
+        return False
+
+
 def autostart_dir() -> Path:
     return Path.home() / ".config" / "autostart"
 
@@ -66,7 +91,9 @@ def is_wayland_session() -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
 def active_env_summary() -> str:
+    # Session variables do not change during the process lifetime; compute once.
     session = os.environ.get("XDG_SESSION_TYPE", "unknown")
     de = os.environ.get("XDG_CURRENT_DESKTOP", "")
     return f"session={session}, desktop={de}"
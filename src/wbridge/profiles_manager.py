@@ -130,11 +130,11 @@ def _load_json_pkg(path: Any) -> Optional[dict]:
         return None
 
 
-def _load_ini_pkg(path: Any) -> Optional[configparser.ConfigParser]:
+def _load_ini_pkg(path: Any) -> Optional[configparser.RawConfigParser]:
     txt = _read_pkg_text(path)
     if txt is None:
         return None
-    cp = configparser.ConfigParser()
+    cp = configparser.RawConfigParser()
     try:
         cp.read_string(txt)
         return cp
@@ -425,7 +425,7 @@ def _shortcut_alias_from_command(cmd: str) -> Optional[str]:
         return None
 
 
-def _merge_shortcuts_section(sp: configparser.ConfigParser, mapping: Dict[str, str]) -> Dict[str, int]:
+def _merge_shortcuts_section(sp: configparser.RawConfigParser, mapping: Dict[str, str]) -> Dict[str, int]:
     """
     Merge alias->binding entries into settings.ini under [gnome.shortcuts].
     Returns counts: {"installed": merged, "skipped": skipped}
@@ -448,7 +448,7 @@ def _merge_shortcuts_section(sp: configparser.ConfigParser, mapping: Dict[str, s
     return {"installed": merged, "skipped": skipped}
 
 
-def _merge_shortcuts_from_items(sp: configparser.ConfigParser, items: List[dict]) -> Dict[str, int]:
+def _merge_shortcuts_from_items(sp: configparser.RawConfigParser, items: List[dict]) -> Dict[str, int]:
     """
     Merge GNOME shortcuts defined as a list of dicts (profile shortcuts.json)
     into settings.ini's [gnome.shortcuts] using derived trigger aliases.
@@ -534,10 +534,10 @@ def install_profile(name: str, *, overwrite_actions: bool = False,
         try:
             # Read or create settings.ini
             if settings_path.exists():
-                sp = configparser.ConfigParser()
+                sp = configparser.RawConfigParser()
                 sp.read(settings_path)
             else:
-                sp = configparser.ConfigParser()
+                sp = configparser.RawConfigParser()
 
             merged_keys: List[str] = []
             skipped_keys: List[str] = []
@@ -619,10 +619,10 @@ def install_profile(name: str, *, overwrite_actions: bool = False,
         try:
             # Load or create settings.ini to merge shortcut bindings under [gnome.shortcuts]
             if settings_path.exists():
-                sp = configparser.ConfigParser()
+                sp = configparser.RawConfigParser()
                 sp.read(settings_path)
             else:
-                sp = configparser.ConfigParser()
+                sp = configparser.RawConfigParser()
 
             res = _merge_shortcuts_from_items(sp, prof_shortcuts)
 
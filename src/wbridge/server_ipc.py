@@ -7,6 +7,8 @@ IPC server (Unix Domain Socket) for wbridge.
 
 Security:
 - Socket path: $XDG_RUNTIME_DIR/wbridge.sock (0600)
+- Linux: additionally listens on an abstract-namespace name (see
+  platform.abstract_socket_name); connections there are accepted only from the same uid.
 """
 
 from __future__ import annotations
@@ -15,12 +17,13 @@ import json
 import os
 import selectors
 import socket
+import sys
 import threading
 from typing import Any, Callable, Dict, Optional
 import logging
 import time
 
-from .platform import socket_path
+from .platform import socket_path, abstract_socket_name, peer_is_same_user
 
 
 Request = Dict[str, Any]
@@ -28,6 +31,16 @@ Response = Dict[str, Any]
 Handler = Callable[[Request], Response]
 
 
+def _new_listener() -> socket.socket:
+    # Non-blocking from the socket() call itself where supported (Linux), saving the
+    # separate setblocking() syscall; CPython already adds SOCK_CLOEXEC on its own.
+    if hasattr(socket, "SOCK_NONBLOCK"):
+        return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM | socket.SOCK_NONBLOCK)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    return sock
+
+
 class IPCServer:
     def __init__(self, handler: Handler) -> None:
         self._handler = handler
@@ -35,6 +48,7 @@ class IPCServer:
         self._stop_event = threading.Event()
         self._selector: Optional[selectors.BaseSelector] = None
         self._server_sock: Optional[socket.socket] = None
+        self._abstract_sock: Optional[socket.socket] = None
         self._path = str(socket_path())
 
     def start(self) -> None:
@@ -51,11 +65,12 @@ class IPCServer:
                 self._selector.close()
             except Exception:
                 pass
-        if self._server_sock:
-            try:
-                self._server_sock.close()
-            except Exception:
-                pass
+        for lsock in (self._server_sock, self._abstract_sock):
+            if lsock:
+                try:
+                    lsock.close()
+                except Exception:
+                    pass
         # Remove socket file
         try:
             if os.path.exists(self._path):
@@ -76,7 +91,7 @@ class IPCServer:
         sel = selectors.DefaultSelector()
         self._selector = sel
 
-        srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        srv = _new_listener()
         self._server_sock = srv
         try:
             srv.bind(self._path)
@@ -90,8 +105,10 @@ class IPCServer:
             pass
 
         srv.listen(16)
-        srv.setblocking(False)
         sel.register(srv, selectors.EVENT_READ)
+        asrv = self._bind_abstract()
+        if asrv is not None:
+            sel.register(asrv, selectors.EVENT_READ)
 
         try:
             while not self._stop_event.is_set():
@@ -99,6 +116,8 @@ class IPCServer:
                 for key, _ in events:
                     if key.fileobj is srv:
                         self._accept(sel, srv)
+                    elif asrv is not None and key.fileobj is asrv:
+                        self._accept(sel, asrv, check_peer=True)
                     else:
                         conn_obj = key.fileobj
                         if isinstance(conn_obj, socket.socket):
@@ -118,19 +137,46 @@ class IPCServer:
                 sel.close()
             except Exception:
                 pass
-            try:
-                srv.close()
-            except Exception:
-                pass
+            for lsock in (srv, asrv):
+                if lsock is None:
+                    continue
+                try:
+                    lsock.close()
+                except Exception:
+                    pass
             try:
                 if os.path.exists(self._path):
                     os.remove(self._path)
             except Exception:
                 pass
 
-    def _accept(self, sel: selectors.BaseSelector, srv: socket.socket) -> None:
+    def _bind_abstract(self) -> Optional[socket.socket]:
+        """
+        Listen on the abstract-namespace name as well (Linux only). Best-effort:
+        clients fall back to the filesystem socket if this is unavailable.
+        """
+        name = abstract_socket_name()
+        if name is None:
+            return None
+        asrv = _new_listener()
+        try:
+            asrv.bind(name)
+            asrv.listen(16)
+        except OSError as e:
+            # EADDRINUSE here may mean another user holds the name; clients verify the
+            # peer uid and fall back to the filesystem socket in that case.
+            logging.getLogger("wbridge").warning("ipc.abstract_bind_failed error=%r", e)
+            asrv.close()
+            return None
+        self._abstract_sock = asrv
+        return asrv
+
+    def _accept(self, sel: selectors.BaseSelector, srv: socket.socket, check_peer: bool = False) -> None:
         try:
             conn, _ = srv.accept()
+            if check_peer and not peer_is_same_user(conn):
+                conn.close()
+                return
             conn.setblocking(False)
             sel.register(conn, selectors.EVENT_READ, data=b"")
         except BlockingIOError:
@@ -149,21 +195,26 @@ class IPCServer:
             conn.close()
             return
 
-        # We accept possibly multiple newline-delimited JSON messages in one recv.
+        # We accept possibly multiple newline-delimited JSON messages in one recv;
+        # their responses are written back with a single sendall.
+        out = []
         for line in data.splitlines():
             if not line:
                 continue
             response = self._handle_line(line)
+            out.append(json.dumps(response) + "\n")
+        if not out:
+            return
+        try:
+            conn.sendall("".join(out).encode("utf-8"))
+        except Exception:
+            # Close on send failure
             try:
-                conn.sendall((json.dumps(response) + "\n").encode("utf-8"))
+                sel.unregister(conn)
             except Exception:
-                # Close on send failure
-                try:
-                    sel.unregister(conn)
-                except Exception:
-                    pass
-                conn.close()
-                return
+                pass
+            conn.close()
+            return
 
     def _handle_line(self, line: bytes) -> Response:
         logger = logging.getLogger("wbridge")
@@ -177,9 +228,12 @@ class IPCServer:
                 pass
             return {"ok": False, "error": f"invalid json: {e}", "code": "INVALID_ARG"}
 
-        # Extract op and useful extras for logging
+        # Extract op and useful extras for logging. The op name is interned so the
+        # handler's dispatch-table lookup matches its (interned) keys by identity.
         try:
-            op = str(req.get("op", ""))
+            op = req.get("op", "")
+            op = sys.intern(op) if isinstance(op, str) else str(op)
+            req["op"] = op
         except Exception:
             op = ""
         extra = ""
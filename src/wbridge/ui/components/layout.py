@@ -0,0 +1,19 @@
+# SPDX-License-Identifier: MIT
+# Small layout helpers shared by the pages.
+
+from __future__ import annotations
+
+import gi
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk  # type: ignore
+
+
+def set_margins(widget: Gtk.Widget, margin: int) -> None:
+    """
+    Set the same margin on all four sides of a widget.
+    Usage: set_margins(self, 16) for page roots, set_margins(box, 10) inside frames.
+    """
+    widget.set_margin_start(margin)
+    widget.set_margin_end(margin)
+    widget.set_margin_top(margin)
+    widget.set_margin_bottom(margin)
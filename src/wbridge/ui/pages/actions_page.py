@@ -24,16 +24,18 @@ gi.require_version("Gdk", "4.0")
 from gi.repository import Gtk, GLib  # type: ignore
 from gi.repository import Pango  # type: ignore
 
-from ...actions import run_action, ActionContext  # type: ignore
+from ...actions import run_action_async, ActionContext  # type: ignore
 from ...config import (  # type: ignore
     load_actions,
     load_actions_raw,
     write_actions_config,
     validate_action_dict,
+    ACTIONS_UNCHANGED,
 )
 from ..components.help_panel import build_help_panel
 from ..components.page_header import build_page_header
 from ..components.cta_bar import build_cta_bar
+from ..components.layout import set_margins
 from .history_page import HistoryPage
 
 
@@ -45,6 +47,13 @@ except Exception:
     _ = lambda s: s
 
 
+def _backup_note(backup) -> str:
+    """Status suffix for a write_actions_config() result."""
+    if backup is ACTIONS_UNCHANGED:
+        return _("no changes, nothing written")
+    return f"backup: {backup}"
+
+
 class ActionsPage(Gtk.Box):
     """Actions page container (master/detail)."""
 
@@ -61,10 +70,7 @@ class ActionsPage(Gtk.Box):
         except Exception:
             pass
 
-        self.set_margin_start(16)
-        self.set_margin_end(16)
-        self.set_margin_top(16)
-        self.set_margin_bottom(16)
+        set_margins(self, 16)
 
         # Internal state
         self._actions_selected_name: Optional[str] = None
@@ -755,11 +761,27 @@ class ActionsPage(Gtk.Box):
             sel_type = "clipboard"
 
         ctx = ActionContext(text=sel_text, selection_type=sel_type, settings_map=self._get_settings_map(), extra={"selection.type": sel_type})
-        ok, message = run_action(action, ctx)
-        if ok:
-            self.actions_result.set_text(f"Success: {message}")
-        else:
-            self.actions_result.set_text(f"Failed: {message}")
+        # Run off the GTK main thread; the result label is updated via idle callback
+        self.actions_result.set_text(_("Running…"))
+
+        def _show_result(ok: bool, message: str) -> bool:
+            if ok:
+                self.actions_result.set_text(f"Success: {message}")
+            else:
+                self.actions_result.set_text(f"Failed: {message}")
+            return False
+
+        def _on_done(fut) -> None:
+            try:
+                ok, message = fut.result()
+            except Exception as e:
+                ok, message = False, str(e)
+            GLib.idle_add(_show_result, ok, message)
+
+        try:
+            run_action_async(action, ctx).add_done_callback(_on_done)
+        except Exception as e:
+            _show_result(False, str(e))
 
     def _on_reload_actions_clicked(self, _btn: Gtk.Button) -> None:
         app = self._main.get_application()
@@ -858,7 +880,7 @@ class ActionsPage(Gtk.Box):
                 pass
             self._actions_selected_name = new_name
             self.refresh_actions_list()
-            self.actions_result.set_text(f"Action saved (form) (backup: {backup})")
+            self.actions_result.set_text(f"Action saved (form) ({_backup_note(backup)})")
         except Exception as e:
             self.actions_result.set_text(f"Save (Form) failed: {e!r}")
 
@@ -903,7 +925,7 @@ class ActionsPage(Gtk.Box):
                 pass
             self._actions_selected_name = new_name
             self.refresh_actions_list()
-            self.actions_result.set_text(f"Action saved (JSON) (backup: {backup})")
+            self.actions_result.set_text(f"Action saved (JSON) ({_backup_note(backup)})")
         except Exception as e:
             self.actions_result.set_text(f"Save failed: {e!r}")
 
@@ -951,7 +973,7 @@ class ActionsPage(Gtk.Box):
                 self._logger.info("actions.duplicate ok source=%s new=%s", original_name, new_name)
             except Exception:
                 pass
-            self.actions_result.set_text(f"Action duplicated as '{new_name}' (backup: {backup})")
+            self.actions_result.set_text(f"Action duplicated as '{new_name}' ({_backup_note(backup)})")
         except Exception as e:
             self.actions_result.set_text(f"Duplicate failed: {e!r}")
 
@@ -990,7 +1012,7 @@ class ActionsPage(Gtk.Box):
                 self._logger.info("actions.delete ok name=%s", name)
             except Exception:
                 pass
-            self.actions_result.set_text(f"Action '{name}' deleted (backup: {backup})")
+            self.actions_result.set_text(f"Action '{name}' deleted ({_backup_note(backup)})")
         except Exception as e:
             self.actions_result.set_text(f"Delete failed: {e!r}")
 
@@ -1030,7 +1052,7 @@ class ActionsPage(Gtk.Box):
                 self._logger.info("actions.add ok name=%s", name)
             except Exception:
                 pass
-            self.actions_result.set_text(f"Action '{name}' added (backup: {backup})")
+            self.actions_result.set_text(f"Action '{name}' added ({_backup_note(backup)})")
         except Exception as e:
             self.actions_result.set_text(f"Add failed: {e!r}")
 
@@ -33,6 +33,7 @@ except Exception:
 from ..components.help_panel import build_help_panel
 from ..components.page_header import build_page_header
 from ..components.cta_bar import build_cta_bar
+from ..components.layout import set_margins
 
 
 class HistoryPage(Gtk.Box):
@@ -42,6 +43,9 @@ class HistoryPage(Gtk.Box):
         """Initialize the page with a reference to the MainWindow."""
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         self._main = main_window  # reference to MainWindow for app access
+        # Clipboard handles are looked up once by MainWindow and shared
+        self._clipboard = main_window._clipboard  # type: ignore[attr-defined]
+        self._primary = main_window._primary  # type: ignore[attr-defined]
         try:
             self.set_hexpand(True)
             self.set_vexpand(True)
@@ -55,10 +59,7 @@ class HistoryPage(Gtk.Box):
         self._reading_cb: bool = False
         self._reading_pr: bool = False
 
-        self.set_margin_start(16)
-        self.set_margin_end(16)
-        self.set_margin_top(16)
-        self.set_margin_bottom(16)
+        set_margins(self, 16)
 
         # Scrollbarer Inhaltscontainer (CTA bleibt unten fix)
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
@@ -97,10 +98,7 @@ class HistoryPage(Gtk.Box):
             cb_box.set_vexpand(True)
         except Exception:
             pass
-        cb_box.set_margin_start(10)
-        cb_box.set_margin_end(10)
-        cb_box.set_margin_top(10)
-        cb_box.set_margin_bottom(10)
+        set_margins(cb_box, 10)
 
         self.cb_entry = Gtk.Entry()
         self.cb_entry.set_placeholder_text(_("Type text here and click Set …"))
@@ -162,10 +160,7 @@ class HistoryPage(Gtk.Box):
             pr_box.set_vexpand(True)
         except Exception:
             pass
-        pr_box.set_margin_start(10)
-        pr_box.set_margin_end(10)
-        pr_box.set_margin_top(10)
-        pr_box.set_margin_bottom(10)
+        set_margins(pr_box, 10)
 
         self.pr_entry = Gtk.Entry()
         self.pr_entry.set_placeholder_text(_("Type text here and click Set …"))
@@ -283,9 +278,8 @@ class HistoryPage(Gtk.Box):
 
     def update_current_labels_async(self) -> None:
         """Asynchronously read current selections and update caches/labels."""
-        disp = Gdk.Display.get_default()
         try:
-            cb = disp.get_clipboard()
+            cb = self._clipboard
 
             def _on_cb(source, res):
                 try:
@@ -312,7 +306,7 @@ class HistoryPage(Gtk.Box):
             pass
 
         try:
-            prim = disp.get_primary_clipboard()
+            prim = self._primary
 
             def _on_pr(source, res):
                 try:
@@ -366,8 +360,7 @@ class HistoryPage(Gtk.Box):
         self._apply_text("clipboard", text)
 
     def on_get_clipboard_clicked(self, _btn: Gtk.Button) -> None:
-        disp = Gdk.Display.get_default()
-        cb = disp.get_clipboard()
+        cb = self._clipboard
 
         def on_finish(source, res):
             try:
@@ -384,8 +377,7 @@ class HistoryPage(Gtk.Box):
         self._apply_text("primary", text)
 
     def on_get_primary_clicked(self, _btn: Gtk.Button) -> None:
-        disp = Gdk.Display.get_default()
-        prim = disp.get_primary_clipboard()
+        prim = self._primary
 
         def on_finish(source, res):
             try:
@@ -453,8 +445,7 @@ class HistoryPage(Gtk.Box):
 
     def _apply_text(self, which: str, text: str) -> None:
         # Set via GDK
-        disp = Gdk.Display.get_default()
-        clip = disp.get_primary_clipboard() if which == "primary" else disp.get_clipboard()
+        clip = self._primary if which == "primary" else self._clipboard
         if hasattr(clip, "set"):
             try:
                 clip.set(text)  # type: ignore[attr-defined]
@@ -507,8 +498,7 @@ class HistoryPage(Gtk.Box):
         GLib.timeout_add(600, _later_refresh)  # type: ignore
 
     def _update_after_set(self, which: str) -> None:
-        disp = Gdk.Display.get_default()
-        clip = disp.get_primary_clipboard() if which == "primary" else disp.get_clipboard()
+        clip = self._primary if which == "primary" else self._clipboard
 
         def on_finish(source, res):
             try:
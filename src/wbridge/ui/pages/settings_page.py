@@ -32,6 +32,7 @@ from ...config import (  # type: ignore
     set_manage_shortcuts,
     get_secrets_map,
     set_secrets_map,
+    batched_settings_write,
 )
 from ...profiles_manager import (  # type: ignore
     list_builtin_profiles,
@@ -40,6 +41,7 @@ from ...profiles_manager import (  # type: ignore
 )
 from ..components.help_panel import build_help_panel
 from ..components.page_header import build_page_header
+from ..components.layout import set_margins
 from ... import gnome_shortcuts  # type: ignore
 
 
@@ -59,10 +61,7 @@ class SettingsPage(Gtk.Box):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         self._main = main_window  # reference to MainWindow for app access
 
-        self.set_margin_start(16)
-        self.set_margin_end(16)
-        self.set_margin_top(16)
-        self.set_margin_bottom(16)
+        set_margins(self, 16)
 
         _help = build_help_panel("settings")
         header = build_page_header(_("Settings"), None, _help)
@@ -481,13 +480,14 @@ class SettingsPage(Gtk.Box):
                 return
 
             eid_old = self._editing_endpoint_id
-            # If ID changed, remove old section first
-            if eid_old and eid_old != eid_new:
-                try:
-                    delete_endpoint(eid_old)
-                except Exception:
-                    pass
-            upsert_endpoint(eid_new, base, health_path=health, trigger_path=trigger)
+            with batched_settings_write() as parser:
+                # If ID changed, remove old section first
+                if eid_old and eid_old != eid_new:
+                    try:
+                        delete_endpoint(eid_old, parser=parser)
+                    except Exception:
+                        pass
+                upsert_endpoint(eid_new, base, health_path=health, trigger_path=trigger, parser=parser)
             self.endpoints_result.set_text(_("Endpoint saved."))
             self.reload_settings()
         except Exception as e:
@@ -663,18 +663,28 @@ class SettingsPage(Gtk.Box):
     def _on_shortcuts_save_clicked(self, _btn: Gtk.Button) -> None:
         try:
             mapping = self._collect_shortcuts_mapping()
-            set_shortcuts_map(mapping)
-            set_manage_shortcuts(bool(self.manage_shortcuts_chk.get_active()))
+            with batched_settings_write() as parser:
+                set_shortcuts_map(mapping, parser=parser)
+                set_manage_shortcuts(bool(self.manage_shortcuts_chk.get_active()), parser=parser)
             # After saving INI, auto-apply if enabled
             if bool(self.manage_shortcuts_chk.get_active()):
-                smap = load_settings().as_mapping()
-                res = gnome_shortcuts.sync_from_ini(smap, auto_remove=True)
-                self._notify_sc(_("Saved and applied: installed={i} updated={u} removed={r} skipped={s}").format(
-                    i=res.get("installed", 0),
-                    u=res.get("updated", 0),
-                    r=res.get("removed", 0),
-                    s=res.get("skipped", 0),
-                ))
+                def _done(res: Optional[Dict[str, int]], err: Optional[BaseException]) -> None:
+                    if err is not None or res is None:
+                        # settings.ini is already saved; only applying the shortcuts failed
+                        self._notify_sc(_("Saved, but applying shortcuts failed: {err}").format(err=repr(err)))
+                        return
+                    self._notify_sc(_("Saved and applied: installed={i} updated={u} removed={r} skipped={s}").format(
+                        i=res.get("installed", 0),
+                        u=res.get("updated", 0),
+                        r=res.get("removed", 0),
+                        s=res.get("skipped", 0),
+                    ))
+
+                try:
+                    smap = load_settings().as_mapping()
+                    gnome_shortcuts.sync_from_ini_async(smap, _done, auto_remove=True)
+                except Exception as e:
+                    _done(None, e)
             else:
                 self._notify_sc(_("Saved. Auto-apply is OFF."))
             self.reload_settings()
@@ -689,15 +699,20 @@ class SettingsPage(Gtk.Box):
             self._notify_sc(_("Revert failed: {err}").format(err=repr(e)))
 
     def _on_shortcuts_apply_now_clicked(self, _btn: Gtk.Button) -> None:
-        try:
-            smap = load_settings().as_mapping()
-            res = gnome_shortcuts.sync_from_ini(smap, auto_remove=True)
+        def _done(res: Optional[Dict[str, int]], err: Optional[BaseException]) -> None:
+            if err is not None or res is None:
+                self._notify_sc(_("Apply failed: {err}").format(err=repr(err)))
+                return
             self._notify_sc(_("Applied: installed={i} updated={u} removed={r} skipped={s}").format(
                 i=res.get("installed", 0),
                 u=res.get("updated", 0),
                 r=res.get("removed", 0),
                 s=res.get("skipped", 0),
             ))
+
+        try:
+            smap = load_settings().as_mapping()
+            gnome_shortcuts.sync_from_ini_async(smap, _done, auto_remove=True)
         except Exception as e:
             self._notify_sc(_("Apply failed: {err}").format(err=repr(e)))
 
@@ -27,6 +27,7 @@ from ... import gnome_shortcuts  # type: ignore
 from ..components.help_panel import build_help_panel
 from ..components.page_header import build_page_header
 from ..components.cta_bar import build_cta_bar
+from ..components.layout import set_margins
 
 
 # i18n init (fallback to identity if no translations installed)
@@ -71,10 +72,7 @@ class ShortcutsPage(Gtk.Box):
         except Exception:
             pass
 
-        self.set_margin_start(16)
-        self.set_margin_end(16)
-        self.set_margin_top(16)
-        self.set_margin_bottom(16)
+        set_margins(self, 16)
 
         # Scrollable content container (CTA bar stays fixed at bottom)
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
@@ -236,9 +234,10 @@ class ShortcutsPage(Gtk.Box):
             self._notify(_("Save failed: {err}").format(err=repr(e)))
 
     def _on_apply_now_clicked(self, _btn: Gtk.Button) -> None:
-        try:
-            smap = load_settings().as_mapping()
-            res = gnome_shortcuts.sync_from_ini(smap, auto_remove=True)
+        def _done(res: Optional[Dict[str, int]], err: Optional[BaseException]) -> None:
+            if err is not None or res is None:
+                self._notify(_("Apply failed: {err}").format(err=repr(err)))
+                return
             self._notify(_("Applied: installed={i} updated={u} removed={r} skipped={s}").format(
                 i=res.get("installed", 0),
                 u=res.get("updated", 0),
@@ -247,6 +246,11 @@ class ShortcutsPage(Gtk.Box):
             ))
             # After applying, refresh audit to show current 'Installed Binding'
             self.reload()
+
+        try:
+            smap = load_settings().as_mapping()
+            # dconf writes run on a worker thread; _done is called on the main loop
+            gnome_shortcuts.sync_from_ini_async(smap, _done, auto_remove=True)
         except Exception as e:
             self._notify(_("Apply failed: {err}").format(err=repr(e)))
 
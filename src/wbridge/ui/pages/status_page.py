@@ -20,6 +20,7 @@ from gi.repository import Gtk, Gdk, GObject, GLib  # type: ignore
 from ...platform import active_env_summary, xdg_state_dir  # type: ignore
 from ..components.help_panel import build_help_panel
 from ..components.page_header import build_page_header
+from ..components.layout import set_margins
 
 
 # i18n init (fallback to identity if no translations installed)
@@ -43,10 +44,7 @@ class StatusPage(Gtk.Box):
         except Exception:
             pass
 
-        self.set_margin_start(16)
-        self.set_margin_end(16)
-        self.set_margin_top(16)
-        self.set_margin_bottom(16)
+        set_margins(self, 16)
 
         _help = build_help_panel("status")
         header = build_page_header(_("Status"), None, _help)
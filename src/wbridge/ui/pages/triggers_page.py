@@ -19,10 +19,11 @@ import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib  # type: ignore
 
-from ...config import load_actions_raw, write_actions_config, load_actions  # type: ignore
+from ...config import load_actions_raw, write_actions_config, load_actions, ACTIONS_UNCHANGED  # type: ignore
 from ..components.help_panel import build_help_panel
 from ..components.page_header import build_page_header
 from ..components.cta_bar import build_cta_bar
+from ..components.layout import set_margins
 
 
 # i18n init (fallback to identity if no translations installed)
@@ -46,10 +47,7 @@ class TriggersPage(Gtk.Box):
         except Exception:
             pass
 
-        self.set_margin_start(16)
-        self.set_margin_end(16)
-        self.set_margin_top(16)
-        self.set_margin_bottom(16)
+        set_margins(self, 16)
 
         # Scrollbarer Inhaltscontainer (CTA bleibt unten fix)
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
@@ -210,7 +208,7 @@ class TriggersPage(Gtk.Box):
 
             # rebuild our UI
             self.rebuild_editor()
-            self._notify(f"Triggers saved (backup: {backup})")
+            self._notify("Triggers unchanged (nothing to save)" if backup is ACTIONS_UNCHANGED else f"Triggers saved (backup: {backup})")
         except Exception as e:
             self._notify(f"Save Triggers failed: {e!r}")
 